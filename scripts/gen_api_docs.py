@@ -90,6 +90,7 @@ def generate_api(lang: str) -> str:
             "| `.optional()` | 欠損値と `None` を許容 |" if ja else "| `.optional()` | Allow missing values and `None` |",
             "| `.default(value)` | 欠損時の値を補完 |" if ja else "| `.default(value)` | Fill missing values |",
             "| `.coerce()` | 可能な範囲で型変換 |" if ja else "| `.coerce()` | Coerce compatible values |",
+            "| `.strict(enabled=True)` | `str` / `int` / `float` の厳密な型一致 (既定で有効) |" if ja else "| `.strict(enabled=True)` | Exact `str` / `int` / `float` type matching (enabled by default) |",
             "| `.custom(func)` | 追加の検証・変換 |" if ja else "| `.custom(func)` | Add validation or transformation |",
             "| `.when(func)` | 親データに基づく条件付き必須 |" if ja else "| `.when(func)` | Conditional requirement based on root data |",
             "| `.env(key, decryptor=None)` | 環境変数フォールバック |" if ja else "| `.env(key, decryptor=None)` | Environment fallback |",
@@ -101,6 +102,7 @@ def generate_api(lang: str) -> str:
     )
 
     validate_sig = signature(validator_module.validate)
+    validate_many_sig = signature(validator_module.validate_many)
     compile_sig = signature(compiled_module.compile)
     schema_sig = signature(validator_module.Schema)
     validator_methods = ", ".join(f"`{m}`" for m in public_methods(v_module.Validator))
@@ -124,6 +126,14 @@ def generate_api(lang: str) -> str:
 
     {"データとスキーマを受け取り、検証済みデータを返します。`collect_errors=True` の場合は `ValidationResult` を返し、複数のエラーをまとめて確認できます。" if ja else "Validates data against a schema. With `collect_errors=True`, it returns `ValidationResult` and gathers multiple errors."}
 
+    ### `validate_many`
+
+    ```text
+    validate_many{validate_many_sig}
+    ```
+
+    {"複数のデータを同じスキーマで検証し、結果をリストで返します。スキーマの解決は最初に一度だけ行います。`collect_errors=True` の場合は要素ごとの `ValidationResult` を返します。" if ja else "Validates many items against one schema and returns a list of results. The schema is resolved once up front. With `collect_errors=True`, it returns one `ValidationResult` per item."}
+
     ### `compile`
 
     ```text
@@ -384,6 +394,18 @@ def generate_compile(lang: str) -> str:
     user_schema.validate({{"id": 1, "name": "Alice", "roles": ["admin"]}})
     ```
 
+    {"`Schema` を使っている場合は `Schema.compile()` でもコンパイルできます。コンパイル結果は `Schema` に保持され、以降の `validate(data, schema)` がそのまま生成コードを使います。" if ja else "When you already use `Schema`, call `Schema.compile()` instead. The compiled result is kept on the `Schema`, and later `validate(data, schema)` calls use the generated code directly."}
+
+    ```python
+    from validkit import Schema, v, validate
+
+    USER_SCHEMA = Schema({{"id": v.int(), "name": v.str().min(3)}})
+    USER_SCHEMA.compile()
+
+    validate({{"id": 1, "name": "Alice"}}, USER_SCHEMA)
+    USER_SCHEMA.validate({{"id": 2, "name": "Bob"}})  # {"同じ結果" if ja else "same result"}
+    ```
+
     ## {"向いている用途" if ja else "Best fit"}
 
     - {"API リクエストを大量に検証する処理" if ja else "High-volume API payload validation"}
@@ -1,6 +1,22 @@
+from typing import TYPE_CHECKING, Any
+
 from .v import v, InstanceValidator
-from .validator import validate, ValidationError, Schema, ValidationResult
-from .compiled import compile, CompiledSchema
+from .validator import validate, validate_many, ValidationError, Schema, ValidationResult
+
+if TYPE_CHECKING:
+    from .compiled import CompiledSchema, compile
 
 __version__ = "1.3.3dev1"
-__all__ = ["v", "validate", "ValidationError", "Schema", "ValidationResult", "InstanceValidator", "compile", "CompiledSchema"]
+__all__ = ["v", "validate", "validate_many", "ValidationError", "Schema", "ValidationResult", "InstanceValidator", "compile", "CompiledSchema"]
+
+
+def __getattr__(name: str) -> Any:
+    # compile / CompiledSchema (and the native-core probe behind them) are loaded on first access
+    if name in ("compile", "CompiledSchema"):
+        from . import compiled
+
+        # Store the result so later lookups hit the module dict and skip __getattr__
+        value = getattr(compiled, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,12 @@
 import re
 import os
+import sys
+import math
 import builtins
-import dataclasses
+import itertools
 from typing import Any, Callable, Dict, List, Optional, Tuple
 from ._native import NATIVE_RUNTIME
-from .validator import ValidationError, ErrorDetail, ValidationResult, _is_class_schema, _class_to_schema
+from .validator import ValidationError, ValidationResult, Schema, _apply_migration, _is_class_schema, _class_to_schema
 from .v import (
     Validator,
     v,
@@ -15,18 +17,38 @@ from .v import (
     ListValidator,
     DictValidator,
     OneOfValidator,
+    _BOOL_COERCE,
+    _LEAF_VALIDATOR_TYPES,
+    _all_plain_items,
+    _has_bulk_check,
 )
 
+# Validator types whose validate() runs no user code beyond the callables checked in
+# _runs_user_callables(); subclasses defined outside validkit may do anything.
+_BUILTIN_VALIDATOR_TYPES = _LEAF_VALIDATOR_TYPES | {ListValidator, DictValidator, OneOfValidator}
+
+def _key_path(prefix: str, key: str) -> str:
+    return f"{prefix}.{key}" if prefix else key
+
+
+def _index_path(prefix: str, index: int) -> str:
+    return f"{prefix}[{index}]" if prefix else f"[{index}]"
+
+
 class CompilerContext:
     def __init__(self) -> None:
         self.context: Dict[str, Any] = {
             "ValidationError": ValidationError,
-            "ErrorDetail": ErrorDetail,
             "os": os,
             "re": re,
             "builtins": builtins,
+            "_key_path": _key_path,
+            "_index_path": _index_path,
+            "_repeat": itertools.repeat,
         }
         self.var_counter = 0
+        # id(condition) -> (bound condition name, per-call result variable name)
+        self.when_conditions: Dict[int, Tuple[str, str]] = {}
 
     def add_object(self, obj: Any) -> str:
         name = f"_obj_{self.var_counter}"
@@ -34,6 +56,23 @@ class CompilerContext:
         self.context[name] = obj
         return name
 
+    def when_expr(self, condition: Callable[[Dict[str, Any]], bool]) -> str:
+        """Return an expression that evaluates *condition* at most once per validation call.
+
+        The same predicate object gating several fields (or every item of a list)
+        shares one result variable, initialised to None by ``when_init_lines()``.
+        """
+        entry = self.when_conditions.get(id(condition))
+        if entry is None:
+            cond_name = self.add_object(condition)
+            entry = (cond_name, f"when{cond_name}")
+            self.when_conditions[id(condition)] = entry
+        cond_name, result_name = entry
+        return f"({result_name} if {result_name} is not None else ({result_name} := bool({cond_name}(root_data))))"
+
+    def when_init_lines(self) -> List[str]:
+        return [f"    {result_name} = None" for _, result_name in self.when_conditions.values()]
+
 class CompiledSchema:
     def __init__(
         self,
@@ -42,8 +81,10 @@ class CompiledSchema:
         validate_collect_func: Any,
         context: CompilerContext,
         native_validator: Any = None,
+        probe_before_collect: bool = True,
     ) -> None:
         self._schema_orig = schema_orig
+        self._probe_before_collect = probe_before_collect
         self._validate_func = validate_func
         self._validate_collect_func = validate_collect_func
         self._context = context
@@ -52,6 +93,8 @@ class CompiledSchema:
         self._native_collect = getattr(native_validator, "collect", None) if native_validator is not None else None
         self._class_builder: Optional[Callable[..., Any]] = None
         if isinstance(schema_orig, type) and _is_class_schema(schema_orig):
+            import dataclasses
+
             if dataclasses.is_dataclass(schema_orig):
                 self._class_builder = schema_orig
             elif hasattr(schema_orig, "_make") and hasattr(schema_orig, "_fields"):
@@ -66,21 +109,9 @@ class CompiledSchema:
         collect_errors: bool = False,
         _force_python: bool = False,
     ) -> Any:
-        # Apply migration if any (using same logic as in validator.py)
+        # Apply migration if any (shared with validator.py)
         if migrate and isinstance(data, dict):
-            data = data.copy()
-            for old_key, action in migrate.items():
-                if old_key in data:
-                    val = data.pop(old_key)
-                    if isinstance(action, str):
-                        data[action] = val
-                    elif callable(action):
-                        result_action = action(val)
-                        if isinstance(result_action, tuple) and len(result_action) == 2:
-                            new_key, new_val = result_action
-                            data[new_key] = new_val
-                        else:
-                            data[old_key] = result_action
+            data = _apply_migration(data, migrate)
 
         if (
             self._native_validate is not None
@@ -110,7 +141,18 @@ class CompiledSchema:
                 if native_errors is not None:
                     return ValidationResult(data, native_errors)
 
-            errors: List[ErrorDetail] = []
+            # Most inputs are valid: probe with the raising validator first and only
+            # run the error-collecting variant once the probe reports a failure. A failed
+            # probe means a second pass, so schemas with user callables skip the probe.
+            if self._probe_before_collect:
+                try:
+                    validated_data = self._validate_func(data, data, "", False, None, partial, base)
+                except ValidationError:
+                    pass
+                else:
+                    return ValidationResult(validated_data)
+
+            errors: List[Any] = []
             try:
                 validated_data = self._validate_collect_func(
                     data,
@@ -162,28 +204,41 @@ def _preprocess_schema(schema: Any) -> Any:
     if _is_class_schema(schema):
         return _class_to_schema(schema)
 
-    # Dictionary schema: preprocess nested schemas
+    # A nested Schema is compiled inline from the schema it wraps
+    if isinstance(schema, Schema):
+        return _preprocess_schema(schema._schema)
+
+    # Dictionary schema: preprocess nested schemas. String keys are interned so the
+    # key objects bound into the generated code can match input keys by identity.
     if isinstance(schema, dict):
-        return {k: _preprocess_schema(v) for k, v in schema.items()}
+        return {
+            (sys.intern(k) if type(k) is str else k): _preprocess_schema(v)
+            for k, v in schema.items()
+        }
 
     return schema
 
 
 def compile(schema: Any) -> CompiledSchema:
+    if isinstance(schema, Schema):
+        return schema.compile()
+
     schema_orig = schema
     preprocessed = _preprocess_schema(schema)
     ctx = CompilerContext()
 
     lines: List[str] = []
     lines.append("def validate_compiled(value, root_data, path_prefix='', collect_errors=False, errors=None, partial=False, base=None):")
-    body_lines, result_var = _gen_code(preprocessed, ctx, "value", "path_prefix", "base", 4, collect_mode=False)
+    body_lines, result_var = _gen_code(preprocessed, ctx, "value", "path_prefix", "base", 4, collect_mode=False, static_path="")
+    lines.extend(ctx.when_init_lines())
     lines.extend(body_lines)
     lines.append(f"    return {result_var}")
 
     collect_lines: List[str] = []
     collect_lines.append("def validate_compiled_collect(value, root_data, path_prefix='', errors=None, partial=False, base=None):")
     collect_lines.append("    collect_errors = True")
-    collect_body_lines, collect_result_var = _gen_code(preprocessed, ctx, "value", "path_prefix", "base", 4, collect_mode=True)
+    collect_body_lines, collect_result_var = _gen_code(preprocessed, ctx, "value", "path_prefix", "base", 4, collect_mode=True, static_path="")
+    collect_lines.extend(ctx.when_init_lines())
     collect_lines.extend(collect_body_lines)
     collect_lines.append(f"    return {collect_result_var}")
 
@@ -199,7 +254,57 @@ def compile(schema: Any) -> CompiledSchema:
     validate_func = local_vars["validate_compiled"]
     validate_collect_func = local_vars["validate_compiled_collect"]
     native_validator = NATIVE_RUNTIME.compile(preprocessed)
-    return CompiledSchema(schema_orig, validate_func, validate_collect_func, ctx, native_validator)
+    return CompiledSchema(
+        schema_orig,
+        validate_func,
+        validate_collect_func,
+        ctx,
+        native_validator,
+        probe_before_collect=not _runs_user_callables(preprocessed),
+    )
+
+
+def _runs_user_callables(schema: Any) -> bool:
+    """Return True if validating *schema* may call user code.
+
+    That covers ``.custom()`` checks, ``.when()`` predicates, ``.env()`` decryptors and
+    Validator subclasses defined outside validkit. Such code must run once per
+    validation, so it cannot be repeated by a probe pass.
+    """
+    if isinstance(schema, dict):
+        return any(_runs_user_callables(sub_schema) for sub_schema in schema.values())
+    if not isinstance(schema, Validator):
+        return False
+    if type(schema) not in _BUILTIN_VALIDATOR_TYPES:
+        return True
+    if schema._custom_checks or schema._when_condition is not None or schema._env_decryptor is not None:
+        return True
+    if isinstance(schema, ListValidator):
+        return _runs_user_callables(_preprocess_schema(schema._item_validator))
+    if isinstance(schema, DictValidator):
+        return _runs_user_callables(_preprocess_schema(schema._value_validator))
+    return False
+
+
+def _bound_literal(bound: Any, ctx: CompilerContext) -> str:
+    """Return source for a numeric bound: a literal when repr() round-trips, else a bound object."""
+    if type(bound) in (int, float) and math.isfinite(bound):
+        return repr(bound)
+    return ctx.add_object(bound)
+
+
+def _constant_literal(value: Any, ctx: CompilerContext) -> str:
+    """Return source for a default value: immutable scalars are inlined, anything else is bound."""
+    if value is None or type(value) in (bool, str) or (type(value) in (int, float) and math.isfinite(value)):
+        return repr(value)
+    return ctx.add_object(value)
+
+
+def _type_mismatch_expr(value_var: str, type_name: str, strict: bool) -> str:
+    """Return a generated-code condition that is true when *value_var* fails the type check."""
+    if strict:
+        return f"type({value_var}) is not {type_name}"
+    return f"type({value_var}) is not {type_name} and not isinstance({value_var}, {type_name})"
 
 
 def _gen_code(
@@ -210,7 +315,15 @@ def _gen_code(
     base_var: str,
     indent: int,
     collect_mode: bool,
+    static_path: Optional[str] = None,
 ) -> Tuple[List[str], str]:
+    """Generate validation code for *schema*.
+
+    ``static_path`` is the dotted error path of *schema* when it is reachable from
+    the root through dict schemas only.  Those paths are known at compile time, so
+    nested dict keys get literal paths instead of per-call string concatenation.
+    ``None`` means the path depends on runtime values (list indexes, dict keys).
+    """
     lines: List[str] = []
     indent_str = " " * indent
 
@@ -224,14 +337,16 @@ def _gen_code(
         lines.append(f"{indent_str}if {value_var} is not None and not isinstance({value_var}, dict):")
         lines.append(f"{indent_str}    err_msg = 'Expected dict, got ' + type({value_var}).__name__")
         if collect_mode:
-            lines.append(f"{indent_str}    errors.append(ErrorDetail({path_var}, err_msg, {value_var}))")
+            lines.append(f"{indent_str}    errors.append(({path_var}, err_msg, {value_var}))")
             lines.append(f"{indent_str}    {dict_result_var} = {value_var}")
         else:
             lines.append(f"{indent_str}    raise ValidationError(err_msg, {path_var}, {value_var})")
 
         lines.append(f"{indent_str}else:")
         lines.append(f"{indent_str}    {dict_result_var} = {{}}")
-        lines.append(f"{indent_str}    {input_dict_var} = {value_var} if {value_var} is not None else {{}}")
+        # Required keys are read with d[key]; dict subclasses (defaultdict, Counter, ...)
+        # are copied to a plain dict first so that __missing__ is never triggered.
+        lines.append(f"{indent_str}    {input_dict_var} = {value_var} if type({value_var}) is dict else dict({value_var}) if {value_var} is not None else {{}}")
         lines.append(f"{indent_str}    {base_dict_var} = {base_var} if isinstance({base_var}, dict) else None")
 
         for key, sub_schema in schema.items():
@@ -239,17 +354,19 @@ def _gen_code(
             ctx.var_counter += 1
 
             key_obj_name = ctx.add_object(key)
-            key_path_name = ctx.add_object(str(key))
             missing_sentinel_name = ctx.add_object(object())
-            current_path_var = f"current_path_{sub_idx}"
             sub_base_var = f"sub_base_{sub_idx}"
             should_validate_var = f"should_validate_{sub_idx}"
 
-            # Setup path variable
-            if path_var == "path_prefix" and indent == 4:
-                lines.append(f"{indent_str}    {current_path_var} = {key_path_name}")
+            # The field path is an expression that is only evaluated when an error is
+            # reported: a literal when the path is static, otherwise a _key_path() call.
+            sub_static_path: Optional[str] = None
+            if static_path is not None:
+                sub_static_path = f"{static_path}.{key}" if static_path else str(key)
+                current_path_var = repr(sub_static_path)
             else:
-                lines.append(f"{indent_str}    {current_path_var} = {path_var} + '.' + {key_path_name} if {path_var} else {key_path_name}")
+                key_path_name = ctx.add_object(str(key))
+                current_path_var = f"_key_path({path_var}, {key_path_name})"
 
             # Sub-schema options validation setup
             is_optional = False
@@ -257,7 +374,7 @@ def _gen_code(
             default_val = None
             env_key = None
             env_decryptor_name = None
-            when_cond_name = None
+            when_check = None
             custom_error_msg = None
             secret_val = False
 
@@ -269,17 +386,33 @@ def _gen_code(
                 if env_key is not None and sub_schema._env_decryptor is not None:
                     env_decryptor_name = ctx.add_object(sub_schema._env_decryptor)
                 if sub_schema._when_condition is not None:
-                    when_cond_name = ctx.add_object(sub_schema._when_condition)
+                    when_check = ctx.when_expr(sub_schema._when_condition)
                 custom_error_msg = sub_schema._custom_error_msg
                 secret_val = sub_schema._secret_val
 
-            # Read logic if key is missing
-            lines.append(f"{indent_str}    val_{sub_idx} = {input_dict_var}.get({key_obj_name}, {missing_sentinel_name})")
+            # Read logic if key is missing: keys that are normally present are indexed
+            # directly, keys that may be absent use .get() to avoid raising KeyError.
+            if is_optional or has_default or env_key is not None or when_check is not None:
+                lines.append(f"{indent_str}    val_{sub_idx} = {input_dict_var}.get({key_obj_name}, {missing_sentinel_name})")
+            else:
+                lines.append(f"{indent_str}    try:")
+                lines.append(f"{indent_str}        val_{sub_idx} = {input_dict_var}[{key_obj_name}]")
+                lines.append(f"{indent_str}    except KeyError:")
+                lines.append(f"{indent_str}        val_{sub_idx} = {missing_sentinel_name}")
             lines.append(f"{indent_str}    {sub_base_var} = {base_dict_var}.get({key_obj_name}) if {base_dict_var} is not None else None")
             lines.append(f"{indent_str}    if val_{sub_idx} is not {missing_sentinel_name}:")
 
             sub_val_var = f"val_{sub_idx}"
-            sub_lines, sub_result_var = _gen_code(sub_schema, ctx, sub_val_var, current_path_var, sub_base_var, indent + 8, collect_mode)
+            sub_lines, sub_result_var = _gen_code(
+                sub_schema,
+                ctx,
+                sub_val_var,
+                current_path_var,
+                sub_base_var,
+                indent + 8,
+                collect_mode,
+                sub_static_path,
+            )
             lines.extend(sub_lines)
 
             lines.append(f"{indent_str}        {dict_result_var}[{key_obj_name}] = {sub_result_var}")
@@ -301,7 +434,7 @@ def _gen_code(
                     lines.append(f"{m_ind}    except Exception as e:")
                     lines.append(f"{m_ind}        err_msg = 'Failed to decrypt env var: ' + str(e)")
                     if collect_mode:
-                        lines.append(f"{m_ind}        errors.append(ErrorDetail({current_path_var}, err_msg, None))")
+                        lines.append(f"{m_ind}        errors.append(({current_path_var}, err_msg, None))")
                     else:
                         lines.append(f"{m_ind}        raise ValidationError(err_msg, {current_path_var}, None)")
                 else:
@@ -317,13 +450,13 @@ def _gen_code(
 
             # 3. Default value
             if has_default:
-                default_val_name = ctx.add_object(default_val)
+                default_val_name = _constant_literal(default_val, ctx)
                 lines.append(f"{m_ind}elif True:")
                 lines.append(f"{m_ind}    {dict_result_var}[{key_obj_name}] = {default_val_name}")
 
             # 4. When condition
-            elif when_cond_name is not None:
-                lines.append(f"{m_ind}elif not {when_cond_name}(root_data):")
+            elif when_check is not None:
+                lines.append(f"{m_ind}elif not {when_check}:")
                 lines.append(f"{m_ind}    pass")
                 lines.append(f"{m_ind}elif {repr(is_optional)} or partial:")
                 lines.append(f"{m_ind}    pass")
@@ -331,7 +464,7 @@ def _gen_code(
                 err_msg = custom_error_msg or "Missing required key"
                 err_val = "None" if not secret_val else "'***'"
                 if collect_mode:
-                    lines.append(f"{m_ind}    errors.append(ErrorDetail({current_path_var}, {repr(err_msg)}, {err_val}))")
+                    lines.append(f"{m_ind}    errors.append(({current_path_var}, {repr(err_msg)}, {err_val}))")
                 else:
                     lines.append(f"{m_ind}    raise ValidationError({repr(err_msg)}, {current_path_var}, {err_val})")
 
@@ -343,7 +476,7 @@ def _gen_code(
                 err_msg = custom_error_msg or "Missing required key"
                 err_val = "None" if not secret_val else "'***'"
                 if collect_mode:
-                    lines.append(f"{m_ind}    errors.append(ErrorDetail({current_path_var}, {repr(err_msg)}, {err_val}))")
+                    lines.append(f"{m_ind}    errors.append(({current_path_var}, {repr(err_msg)}, {err_val}))")
                 else:
                     lines.append(f"{m_ind}    raise ValidationError({repr(err_msg)}, {current_path_var}, {err_val})")
 
@@ -363,6 +496,7 @@ def _gen_code(
                     sub_base_var,
                     missing_indent + 4,
                     collect_mode,
+                    sub_static_path,
                 )
                 lines.extend(env_sub_lines)
 
@@ -376,10 +510,10 @@ def _gen_code(
         res_var = f"res_{idx}"
 
         # Helper variables
-        when_cond_name = None
+        when_check = None
         if schema._when_condition is not None:
-            when_cond_name = ctx.add_object(schema._when_condition)
-            lines.append(f"{indent_str}if not {when_cond_name}(root_data):")
+            when_check = ctx.when_expr(schema._when_condition)
+            lines.append(f"{indent_str}if not {when_check}:")
             lines.append(f"{indent_str}    {res_var} = {base_var}")
             lines.append(f"{indent_str}else:")
             indent += 4
@@ -398,12 +532,11 @@ def _gen_code(
         handled_by_generated_code = True
 
         if isinstance(schema, StringValidator):
+            lines.append(f"{try_indent_str}if {_type_mismatch_expr(value_var, 'str', schema._strict)}:")
             if schema._coerce:
-                lines.append(f"{try_indent_str}if not isinstance({value_var}, str):")
                 lines.append(f"{try_indent_str}    {value_var} = str({value_var})")
-
-            lines.append(f"{try_indent_str}if not isinstance({value_var}, str):")
-            lines.append(f"{try_indent_str}    raise TypeError('Expected str, got ' + type({value_var}).__name__)")
+            else:
+                lines.append(f"{try_indent_str}    raise TypeError('Expected str, got ' + type({value_var}).__name__)")
 
             if schema._min_len is not None:
                 lines.append(f"{try_indent_str}if len({value_var}) < {schema._min_len}:")
@@ -414,58 +547,67 @@ def _gen_code(
                 lines.append(f"{try_indent_str}    raise ValueError('String length ' + str(len({value_var})) + ' is longer than maximum length {schema._max_len}')")
 
             if schema._regex is not None:
-                regex_obj_name = ctx.add_object(schema._regex)
-                lines.append(f"{try_indent_str}if not {regex_obj_name}.match({value_var}):")
-                lines.append(f"{try_indent_str}    raise ValueError(\"Value '\" + str({value_var}) + \"' does not match regex '\" + {regex_obj_name}.pattern + \"'\")")
+                # Bind the pattern's match method once so the generated code skips the attribute lookup.
+                regex_match_name = ctx.add_object(schema._regex.match)
+                regex_suffix = repr(f"' does not match regex '{schema._regex.pattern}'")
+                lines.append(f"{try_indent_str}if not {regex_match_name}({value_var}):")
+                lines.append(f"{try_indent_str}    raise ValueError(\"Value '\" + str({value_var}) + {regex_suffix})")
 
             lines.append(f"{try_indent_str}val_final_{idx} = {value_var}")
 
         elif isinstance(schema, NumberValidator):
             type_cls_name = "int" if schema._type_cls is int else "float"
+            lines.append(f"{try_indent_str}if {_type_mismatch_expr(value_var, type_cls_name, schema._strict)}:")
             if schema._coerce:
-                lines.append(f"{try_indent_str}if not isinstance({value_var}, {type_cls_name}):")
                 lines.append(f"{try_indent_str}    try:")
                 lines.append(f"{try_indent_str}        {value_var} = {type_cls_name}({value_var})")
                 lines.append(f"{try_indent_str}    except (ValueError, TypeError):")
-                lines.append(f"{try_indent_str}        pass")
-
-            lines.append(f"{try_indent_str}if not isinstance({value_var}, {type_cls_name}):")
-            lines.append(f"{try_indent_str}    raise TypeError('Expected {type_cls_name}, got ' + type({value_var}).__name__)")
+                lines.append(f"{try_indent_str}        raise TypeError('Expected {type_cls_name}, got ' + type({value_var}).__name__) from None")
+            else:
+                lines.append(f"{try_indent_str}    raise TypeError('Expected {type_cls_name}, got ' + type({value_var}).__name__)")
 
+            # Each bound is (failure test, error message expression); when both are set the
+            # success path is a single chained comparison and the per-bound tests only run
+            # on failure (so NaN passes exactly as it does in NumberValidator.validate).
+            bound_checks: List[Tuple[str, str]] = []
+            chain = ""
             if schema._min is not None:
+                min_lit = _bound_literal(schema._min, ctx)
                 if schema._exclusive_min:
-                    lines.append(f"{try_indent_str}if {value_var} <= {schema._min}:")
-                    lines.append(f"{try_indent_str}    raise ValueError('Value ' + str({value_var}) + ' must be greater than {schema._min}')")
+                    bound_checks.append((f"{value_var} <= {min_lit}", repr(f" must be greater than {schema._min}")))
+                    chain = f"{min_lit} < {value_var}"
                 else:
-                    lines.append(f"{try_indent_str}if {value_var} < {schema._min}:")
-                    lines.append(f"{try_indent_str}    raise ValueError('Value ' + str({value_var}) + ' is less than minimum {schema._min}')")
-
+                    bound_checks.append((f"{value_var} < {min_lit}", repr(f" is less than minimum {schema._min}")))
+                    chain = f"{min_lit} <= {value_var}"
             if schema._max is not None:
+                max_lit = _bound_literal(schema._max, ctx)
                 if schema._exclusive_max:
-                    lines.append(f"{try_indent_str}if {value_var} >= {schema._max}:")
-                    lines.append(f"{try_indent_str}    raise ValueError('Value ' + str({value_var}) + ' must be less than {schema._max}')")
+                    bound_checks.append((f"{value_var} >= {max_lit}", repr(f" must be less than {schema._max}")))
+                    chain = f"{chain} < {max_lit}" if chain else ""
                 else:
-                    lines.append(f"{try_indent_str}if {value_var} > {schema._max}:")
-                    lines.append(f"{try_indent_str}    raise ValueError('Value ' + str({value_var}) + ' is greater than maximum {schema._max}')")
+                    bound_checks.append((f"{value_var} > {max_lit}", repr(f" is greater than maximum {schema._max}")))
+                    chain = f"{chain} <= {max_lit}" if chain else ""
+
+            check_indent_str = try_indent_str
+            if len(bound_checks) == 2:
+                lines.append(f"{try_indent_str}if not ({chain}):")
+                check_indent_str = try_indent_str + "    "
+            for fail_test, message_suffix in bound_checks:
+                lines.append(f"{check_indent_str}if {fail_test}:")
+                lines.append(f"{check_indent_str}    raise ValueError('Value ' + str({value_var}) + {message_suffix})")
 
             lines.append(f"{try_indent_str}val_final_{idx} = {value_var}")
 
         elif isinstance(schema, BoolValidator):
             if schema._coerce:
-                lines.append(f"{try_indent_str}if not isinstance({value_var}, bool):")
+                bool_coerce_name = ctx.add_object(_BOOL_COERCE)
+                lines.append(f"{try_indent_str}if type({value_var}) is not bool:")
                 lines.append(f"{try_indent_str}    if isinstance({value_var}, str):")
-                lines.append(f"{try_indent_str}        lower_val = {value_var}.lower()")
-                lines.append(f"{try_indent_str}        if lower_val in ('true', '1', 'yes', 'on'):")
-                lines.append(f"{try_indent_str}            {value_var} = True")
-                lines.append(f"{try_indent_str}        elif lower_val in ('false', '0', 'no', 'off'):")
-                lines.append(f"{try_indent_str}            {value_var} = False")
+                lines.append(f"{try_indent_str}        {value_var} = {bool_coerce_name}.get({value_var}.lower(), {value_var})")
                 lines.append(f"{try_indent_str}    elif isinstance({value_var}, (int, float)):")
-                lines.append(f"{try_indent_str}        if {value_var} == 1:")
-                lines.append(f"{try_indent_str}            {value_var} = True")
-                lines.append(f"{try_indent_str}        elif {value_var} == 0:")
-                lines.append(f"{try_indent_str}            {value_var} = False")
+                lines.append(f"{try_indent_str}        {value_var} = {bool_coerce_name}.get({value_var}, {value_var})")
 
-            lines.append(f"{try_indent_str}if not isinstance({value_var}, bool):")
+            lines.append(f"{try_indent_str}if type({value_var}) is not bool:")
             lines.append(f"{try_indent_str}    raise TypeError('Expected bool, got ' + type({value_var}).__name__)")
             lines.append(f"{try_indent_str}val_final_{idx} = {value_var}")
 
@@ -484,15 +626,25 @@ def _gen_code(
             list_res_var = f"list_res_{idx}"
             list_index_var = f"i_list_{idx}"
             list_item_var = f"item_list_{idx}"
-            list_item_path_var = f"item_path_{idx}"
-            lines.append(f"{try_indent_str}{list_res_var} = []")
-            lines.append(f"{try_indent_str}for {list_index_var}, {list_item_var} in enumerate({value_var}):")
-            lines.append(f"{try_indent_str}    {list_item_path_var} = {path_var} + '[' + str({list_index_var}) + ']' if {path_var} else '[' + str({list_index_var}) + ']'")
+            list_item_path_var = f"_index_path({path_var}, {list_index_var})"
+            # Homogeneous int/float and plain oneof lists are checked in bulk; the per-item loop below
+            # only runs when that check fails and precise error paths are needed.
+            loop_indent_str = try_indent_str
+            if _has_bulk_check(schema._item_validator):
+                bulk_check_name = ctx.add_object(_all_plain_items)
+                item_validator_name = ctx.add_object(schema._item_validator)
+                lines.append(f"{try_indent_str}if {bulk_check_name}({item_validator_name}, {value_var}):")
+                lines.append(f"{try_indent_str}    {list_res_var} = list({value_var})")
+                lines.append(f"{try_indent_str}else:")
+                loop_indent_str = try_indent_str + "    "
+
+            lines.append(f"{loop_indent_str}{list_res_var} = []")
+            lines.append(f"{loop_indent_str}for {list_index_var}, {list_item_var} in enumerate({value_var}):")
 
             preprocessed_item = _preprocess_schema(schema._item_validator)
-            item_lines, sub_res_var = _gen_code(preprocessed_item, ctx, list_item_var, list_item_path_var, "None", try_indent + 4, collect_mode)
+            item_lines, sub_res_var = _gen_code(preprocessed_item, ctx, list_item_var, list_item_path_var, "None", len(loop_indent_str) + 4, collect_mode)
             lines.extend(item_lines)
-            lines.append(f"{try_indent_str}    {list_res_var}.append({sub_res_var})")
+            lines.append(f"{loop_indent_str}    {list_res_var}.append({sub_res_var})")
             lines.append(f"{try_indent_str}val_final_{idx} = {list_res_var}")
 
         elif isinstance(schema, DictValidator):
@@ -503,23 +655,48 @@ def _gen_code(
             dict_res_var = f"dict_res_{idx}"
             dict_key_var = f"k_dict_{idx}"
             dict_value_var = f"v_dict_{idx}"
-            dict_item_path_var = f"dict_item_path_{idx}"
-            lines.append(f"{try_indent_str}{dict_res_var} = {{}}")
-            lines.append(f"{try_indent_str}for {dict_key_var}, {dict_value_var} in {value_var}.items():")
-            lines.append(f"{try_indent_str}    if not isinstance({dict_key_var}, {ctx.add_object(schema._key_type)}):")
-            lines.append(f"{try_indent_str}        raise TypeError('Expected key type {key_type_name}, got ' + type({dict_key_var}).__name__)")
-            lines.append(f"{try_indent_str}    {dict_item_path_var} = {path_var} + '.' + str({dict_key_var}) if {path_var} else str({dict_key_var})")
+            dict_item_path_var = f"_key_path({path_var}, str({dict_key_var}))"
+            keys_ok_var = f"keys_ok_{idx}"
+            key_type_obj_name = ctx.add_object(schema._key_type)
+            # Keys are checked in bulk; the per-key check only runs when that fails,
+            # so the first reported error is the same as before.
+            lines.append(f"{try_indent_str}{keys_ok_var} = all(map(isinstance, {value_var}, _repeat({key_type_obj_name})))")
+
+            loop_indent_str = try_indent_str
+            if _has_bulk_check(schema._value_validator):
+                bulk_check_name = ctx.add_object(_all_plain_items)
+                value_validator_name = ctx.add_object(schema._value_validator)
+                lines.append(f"{try_indent_str}if {keys_ok_var} and {bulk_check_name}({value_validator_name}, {value_var}.values()):")
+                lines.append(f"{try_indent_str}    {dict_res_var} = dict({value_var})")
+                lines.append(f"{try_indent_str}else:")
+                loop_indent_str = try_indent_str + "    "
+
+            lines.append(f"{loop_indent_str}{dict_res_var} = {{}}")
+            lines.append(f"{loop_indent_str}for {dict_key_var}, {dict_value_var} in {value_var}.items():")
+            lines.append(f"{loop_indent_str}    if not {keys_ok_var} and not isinstance({dict_key_var}, {key_type_obj_name}):")
+            lines.append(f"{loop_indent_str}        raise TypeError('Expected key type {key_type_name}, got ' + type({dict_key_var}).__name__)")
 
             preprocessed_val = _preprocess_schema(schema._value_validator)
-            val_lines, sub_res_var = _gen_code(preprocessed_val, ctx, dict_value_var, dict_item_path_var, "None", try_indent + 4, collect_mode)
+            val_lines, sub_res_var = _gen_code(preprocessed_val, ctx, dict_value_var, dict_item_path_var, "None", len(loop_indent_str) + 4, collect_mode)
             lines.extend(val_lines)
-            lines.append(f"{try_indent_str}    {dict_res_var}[{dict_key_var}] = {sub_res_var}")
+            lines.append(f"{loop_indent_str}    {dict_res_var}[{dict_key_var}] = {sub_res_var}")
             lines.append(f"{try_indent_str}val_final_{idx} = {dict_res_var}")
 
         elif isinstance(schema, OneOfValidator):
             choices_name = ctx.add_object(schema._choices)
-            lines.append(f"{try_indent_str}if {value_var} not in {choices_name}:")
-            lines.append(f"{try_indent_str}    raise ValueError(\"Value '\" + str({value_var}) + \"' is not one of \" + str({choices_name}))")
+            if schema._choices_set is not None:
+                choices_set_name = ctx.add_object(schema._choices_set)
+                hit_var = f"hit_{idx}"
+                lines.append(f"{try_indent_str}try:")
+                lines.append(f"{try_indent_str}    {hit_var} = {value_var} in {choices_set_name}")
+                lines.append(f"{try_indent_str}except TypeError:")
+                lines.append(f"{try_indent_str}    {hit_var} = {value_var} in {choices_name}")
+                lines.append(f"{try_indent_str}if not {hit_var}:")
+            else:
+                lines.append(f"{try_indent_str}if {value_var} not in {choices_name}:")
+            # The choices are fixed at compile time, so the message tail is a literal.
+            choices_tail = repr(f"' is not one of {list(schema._choices)}")
+            lines.append(f"{try_indent_str}    raise ValueError(\"Value '\" + str({value_var}) + {choices_tail})")
             lines.append(f"{try_indent_str}val_final_{idx} = {value_var}")
 
         elif isinstance(schema, InstanceValidator):
@@ -556,7 +733,7 @@ def _gen_code(
         err_msg_expr = repr(schema._custom_error_msg) if schema._custom_error_msg else "str(e)"
         err_val_expr = "'***'" if schema._secret_val else value_var
         if collect_mode:
-            lines.append(f"{indent_str}    errors.append(ErrorDetail({path_var}, {err_msg_expr}, {err_val_expr}))")
+            lines.append(f"{indent_str}    errors.append(({path_var}, {err_msg_expr}, {err_val_expr}))")
             lines.append(f"{indent_str}    {res_var} = {value_var}")
         else:
             lines.append(f"{indent_str}    raise ValidationError({err_msg_expr}, {path_var}, {err_val_expr})")
@@ -1,12 +1,49 @@
 import re
 import builtins
+import functools
+import itertools
+import math
 import datetime as dt_module
-import uuid as uuid_module
-import ipaddress
-from typing import Any, Callable, Dict, List, Union, Type, Optional, cast
-import urllib.parse
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Sequence, Union, Type, Optional, Tuple, cast
 from enum import Enum
 
+_MAC_PATTERN = re.compile(r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$")
+# S-1-[0-5]-(?:\d+-){1,14}\d+
+_SID_PATTERN = re.compile(r"^S-\d+-(?:\d+-){1,14}\d+$")
+_HEX_PATTERN = re.compile(r"^[0-9A-Fa-f]+$")
+# Simple SemVer regex
+_SEMVER_PATTERN = re.compile(r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$")
+
+
+# validator.py の validate_internal / _report_validator_error / _build_key_plans。循環 import を
+# 避けるため、validator.py の読み込み完了時に _bind_validator_functions() で設定されます。
+_validate_internal: Callable[..., Any]
+_report_validator_error: Callable[..., Any]
+_build_key_plans: Callable[..., Any]
+
+
+def _bind_validator_functions(
+    validate_internal: Callable[..., Any],
+    report_validator_error: Callable[..., Any],
+    build_key_plans: Callable[..., Any],
+) -> None:
+    global _validate_internal, _report_validator_error, _build_key_plans
+    _validate_internal = validate_internal
+    _report_validator_error = report_validator_error
+    _build_key_plans = build_key_plans
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_regex(pattern: str) -> "re.Pattern[str]":
+    """
+    同じパターン文字列の re.Pattern をスキーマ間で共有します。
+
+    ``re`` 自身のキャッシュ (512 件) より大きくし、リクエストごとにスキーマを組み立てる
+    使い方でパターンが多い場合も再コンパイルを避けます。
+    """
+    return re.compile(pattern)
+
+
 class Validator:
     """
     すべてのバリデータの基底クラス。
@@ -16,14 +53,36 @@ class Validator:
         v.str().default("anonymous").description("ユーザー名").examples(["alice", "bob"])
     """
 
+    __slots__ = (
+        "_coerce",
+        "_custom_checks",
+        "_custom_error_msg",
+        "_default_value",
+        "_description",
+        "_env_decryptor",
+        "_env_key",
+        "_examples",
+        "_has_default",
+        "_optional",
+        "_secret_val",
+        "_strict",
+        "_when_condition",
+    )
+
+    # .optional() / .default() / .env() / .when() が呼ばれるたびに増える世代番号。Schema が事前計算した
+    # キー分類 (省略可否・デフォルト・環境変数・末端バリデータかどうか) は、この値が変わったら作り直されます
+    _options_generation: ClassVar[int] = 0
+
     def __init__(self) -> None:
         self._optional = False
-        self._custom_checks: List[Callable[[Any], Any]] = []
+        # 空のチェック・例は全インスタンスで空タプルを共有し、設定時に新しいコンテナへ置き換える
+        self._custom_checks: Tuple[Callable[[Any], Any], ...] = ()
         self._when_condition: Optional[Callable[[Dict[str, Any]], bool]] = None
         self._coerce = False
+        self._strict = True
         self._has_default = False
         self._default_value: Any = None
-        self._examples: List[Any] = []
+        self._examples: Sequence[Any] = ()
         self._description: Optional[str] = None
         self._secret_val = False
         self._env_key: Optional[str] = None
@@ -42,6 +101,7 @@ class Validator:
         """
         self._env_key = env_key
         self._env_decryptor = decryptor
+        Validator._options_generation += 1
         return self
 
     def error_msg(self, msg: str) -> "Validator":
@@ -54,9 +114,25 @@ class Validator:
         self._coerce = True
         return self
 
+    def strict(self, enabled: bool = True) -> "Validator":
+        """
+        ``v.str()`` / ``v.int()`` / ``v.float()`` の型チェックを厳密な型一致で行うかを設定します。
+
+        既定では ``type(value) is int`` のように型が完全に一致する値だけを受け付けるため、
+        ``bool`` は ``int`` として扱われません。``strict(False)`` を指定すると ``isinstance``
+        による判定に戻り、``IntEnum`` や ``str`` のサブクラスも受け付けます。
+
+        Example::
+
+            v.int().strict(False)  # True や IntEnum も int として受け付ける
+        """
+        self._strict = enabled
+        return self
+
     def optional(self) -> "Validator":
         """このフィールドを省略可能にします。"""
         self._optional = True
+        Validator._options_generation += 1
         return self
 
     def default(self, value: Any) -> "Validator":
@@ -77,6 +153,7 @@ class Validator:
         self._has_default = True
         self._default_value = value
         self._optional = True
+        Validator._options_generation += 1
         return self
 
     def examples(self, examples_list: List[Any]) -> "Validator":
@@ -112,7 +189,7 @@ class Validator:
 
     def custom(self, func: Callable[[Any], Any]) -> "Validator":
         """カスタムのバリデーション/変換関数を追加します。"""
-        self._custom_checks.append(func)
+        self._custom_checks = (*self._custom_checks, func)
         return self
 
     def when(self, condition: Callable[[Dict[str, Any]], bool]) -> "Validator":
@@ -128,6 +205,7 @@ class Validator:
             v.str().when(lambda d: d.get("is_premium") is True)
         """
         self._when_condition = condition
+        Validator._options_generation += 1
         return self
 
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Any:
@@ -140,9 +218,12 @@ class Validator:
         return value
 
 class StringValidator(Validator):
+    __slots__ = ("_max_len", "_min_len", "_regex", "_regex_match")
+
     def __init__(self) -> None:
         super().__init__()
         self._regex: Optional[re.Pattern[str]] = None
+        self._regex_match: Optional[Callable[[str], Optional[re.Match[str]]]] = None
         self._min_len: Optional[int] = None
         self._max_len: Optional[int] = None
 
@@ -172,14 +253,15 @@ class StringValidator(Validator):
         return self
 
     def regex(self, pattern: str) -> "StringValidator":
-        self._regex = re.compile(pattern)
+        self._regex = _compile_regex(pattern)
+        self._regex_match = self._regex.match
         return self
 
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> str:
-        if self._coerce and not isinstance(value, str):
+        if type(value) is not str and (self._strict or not isinstance(value, str)):
+            if not self._coerce:
+                raise TypeError(f"Expected str, got {type(value).__name__}")
             value = str(value)
-        if not isinstance(value, str):
-            raise TypeError(f"Expected str, got {type(value).__name__}")
             
         # 1. 最小長チェック
         if self._min_len is not None and len(value) < self._min_len:
@@ -190,11 +272,13 @@ class StringValidator(Validator):
             raise ValueError(f"String length {len(value)} is longer than maximum length {self._max_len}")
             
         # 3. 正規表現チェック
-        if self._regex and not self._regex.match(value):
-            raise ValueError(f"Value '{value}' does not match regex '{self._regex.pattern}'")
-        return cast(str, self._validate_base(value, data))
+        if self._regex_match is not None and not self._regex_match(value):
+            raise ValueError(f"Value '{value}' does not match regex '{cast(re.Pattern[str], self._regex).pattern}'")
+        return cast(str, self._validate_base(value, data) if self._custom_checks else value)
 
 class NumberValidator(Validator):
+    __slots__ = ("_exclusive_max", "_exclusive_min", "_max", "_min", "_type_cls")
+
     def __init__(self, type_cls: Union[Type[int], Type[float]]) -> None:
         super().__init__()
         self._type_cls = type_cls
@@ -239,13 +323,14 @@ class NumberValidator(Validator):
         return self
 
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Union[int, float]:
-        if self._coerce and not isinstance(value, self._type_cls):
+        type_cls = self._type_cls
+        if type(value) is not type_cls and (self._strict or not isinstance(value, type_cls)):
+            if not self._coerce:
+                raise TypeError(f"Expected {type_cls.__name__}, got {type(value).__name__}")
             try:
-                value = self._type_cls(value)
+                value = type_cls(value)
             except (ValueError, TypeError):
-                pass
-        if not isinstance(value, self._type_cls):
-            raise TypeError(f"Expected {self._type_cls.__name__}, got {type(value).__name__}")
+                raise TypeError(f"Expected {type_cls.__name__}, got {type(value).__name__}") from None
         if self._min is not None:
             if self._exclusive_min:
                 if value <= self._min:
@@ -260,28 +345,115 @@ class NumberValidator(Validator):
             else:
                 if value > self._max:
                     raise ValueError(f"Value {value} is greater than maximum {self._max}")
-        return cast(Union[int, float], self._validate_base(value, data))
+        return cast("Union[int, float]", self._validate_base(value, data) if self._custom_checks else value)
+
+# BoolValidator.coerce() の変換表。文字列は小文字化してから、数値はそのまま引きます
+# (1 / 0 のキーは 1.0 / 0.0 / -0.0 とも一致します)。
+_BOOL_COERCE: Dict[Any, bool] = {
+    "true": True, "1": True, "yes": True, "on": True,
+    "false": False, "0": False, "no": False, "off": False,
+    1: True, 0: False,
+}
+
 
 class BoolValidator(Validator):
+    __slots__ = ()
+
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> bool:
-        if self._coerce and not isinstance(value, bool):
+        if self._coerce and type(value) is not bool:
             if isinstance(value, str):
-                lower_val = value.lower()
-                if lower_val in ("true", "1", "yes", "on"):
-                    value = True
-                elif lower_val in ("false", "0", "no", "off"):
-                    value = False
+                value = _BOOL_COERCE.get(value.lower(), value)
             elif isinstance(value, (int, float)):
-                if value == 1:
-                    value = True
-                elif value == 0:
-                    value = False
+                value = _BOOL_COERCE.get(value, value)
 
-        if not isinstance(value, bool):
+        if type(value) is not bool:
             raise TypeError(f"Expected bool, got {type(value).__name__}")
-        return cast(bool, self._validate_base(value, data))
+        return cast(bool, self._validate_base(value, data) if self._custom_checks else value)
+
+def _plain_number_spec(validator: Any) -> Optional[Tuple[Any, Any, Any, bool, bool]]:
+    """
+    ``validator`` が変換や追加処理を伴わない ``int`` / ``float`` であれば
+    ``(型, 最小値, 最大値, 最小値を含まないか, 最大値を含まないか)`` を返します。
+    """
+    if validator is int or validator is float:
+        return validator, None, None, False, False
+    if (
+        type(validator) is NumberValidator
+        and validator._strict
+        and not validator._coerce
+        and not validator._optional
+        and not validator._custom_checks
+        and validator._when_condition is None
+    ):
+        return validator._type_cls, validator._min, validator._max, validator._exclusive_min, validator._exclusive_max
+    return None
+
+
+def _plain_choices(validator: Any) -> Optional[FrozenSet[Any]]:
+    """
+    ``validator`` が追加処理を伴わない ``v.oneof()`` で、候補がすべてハッシュ可能であれば
+    候補の frozenset を返します。
+    """
+    if (
+        type(validator) is OneOfValidator
+        and validator._choices_set is not None
+        and not validator._coerce
+        and not validator._optional
+        and not validator._custom_checks
+        and validator._when_condition is None
+    ):
+        return validator._choices_set
+    return None
+
+
+def _has_bulk_check(validator: Any) -> bool:
+    """``validator`` が :func:`_all_plain_items` による一括判定の対象かどうかを返します。"""
+    return _plain_number_spec(validator) is not None or _plain_choices(validator) is not None
+
+
+def _all_plain_items(validator: Any, values: Any) -> bool:
+    """
+    ``values`` の全要素を組み込み関数で一括判定します。
+
+    数値は型と範囲を ``map`` / ``min`` / ``max`` で、``v.oneof()`` は候補集合の
+    ``issuperset`` で判定します。True のときは全要素が ``validator`` を満たします。
+    False のときは要素ごとの通常検証にフォールバックし、エラー位置とメッセージは
+    そちらで決まります。
+    """
+    choices = _plain_choices(validator)
+    if choices is not None:
+        try:
+            return choices.issuperset(values)
+        except TypeError:
+            # 非ハッシュ可能な要素を含む場合
+            return False
+
+    spec = _plain_number_spec(validator)
+    if spec is None:
+        return False
+    type_cls, lo, hi, exclusive_min, exclusive_max = spec
+
+    if not values:
+        return True
+    if set(map(type, values)) != {type_cls}:
+        return False
+    if type_cls is float and (lo is not None or hi is not None) and any(map(math.isnan, values)):
+        # NaN はどの比較も False になり min() / max() の結果を壊すため、要素ごとの検証に戻す
+        return False
+    if lo is not None:
+        smallest = min(values)
+        if smallest < lo or (exclusive_min and smallest == lo):
+            return False
+    if hi is not None:
+        largest = max(values)
+        if largest > hi or (exclusive_max and largest == hi):
+            return False
+    return True
+
 
 class ListValidator(Validator):
+    __slots__ = ("_item_validator", "_max_len", "_min_len")
+
     def __init__(self, item_validator: Union[Validator, Dict[builtins.str, Any], Type[Any]]) -> None:
         super().__init__()
         self._item_validator = item_validator
@@ -319,17 +491,39 @@ class ListValidator(Validator):
         if self._max_len is not None and len(value) > self._max_len:
             raise ValueError(f"List length {len(value)} is longer than maximum length {self._max_len}")
 
-        from .validator import validate_internal
-        result = []
+        if _all_plain_items(self._item_validator, value):
+            return cast("List[Any]", self._validate_base(list(value), data) if self._custom_checks else list(value))
+
+        result: List[Any] = []
         root_data = data if data is not None else {}
+        item_validator = self._item_validator
+        # 子要素のパスを使わないバリデータは validate を直接呼び、パスはエラー時だけ組み立てる
+        leaf = cast(Validator, item_validator) if _is_leaf_validator(item_validator) else None
+        # dict スキーマの要素はキー分類をこの呼び出しの中でだけ共有する (スキーマの変更に追従するため保持しない)
+        key_plans = _build_key_plans(item_validator) if type(item_validator) is dict and value else None
         for i, item in enumerate(value):
+            if leaf is not None:
+                if item is None and leaf._optional:
+                    result.append(None)
+                    continue
+                try:
+                    result.append(leaf.validate(item, root_data))
+                except (TypeError, ValueError) as e:
+                    item_path = f"{path_prefix}[{i}]" if path_prefix else f"[{i}]"
+                    result.append(_report_validator_error(leaf, e, item_path, item, collect_errors, errors))
+                continue
             # Use path_prefix to build nested path
             item_path = f"{path_prefix}[{i}]" if path_prefix else f"[{i}]"
-            res = validate_internal(item, self._item_validator, root_data, path_prefix=item_path, collect_errors=collect_errors, errors=errors)
+            res = _validate_internal(
+                item, item_validator, root_data, path_prefix=item_path,
+                collect_errors=collect_errors, errors=errors, key_plans=key_plans,
+            )
             result.append(res)
-        return cast(List[Any], self._validate_base(result, data))
+        return cast("List[Any]", self._validate_base(result, data) if self._custom_checks else result)
 
 class DictValidator(Validator):
+    __slots__ = ("_key_type", "_value_validator")
+
     def __init__(self, key_type: Type[Any], value_validator: Union[Validator, Dict[str, Any], Type[Any]]) -> None:
         super().__init__()
         self._key_type = key_type
@@ -338,27 +532,66 @@ class DictValidator(Validator):
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Dict[Any, Any]:
         if not isinstance(value, dict):
             raise TypeError(f"Expected dict, got {type(value).__name__}")
-        from .validator import validate_internal
-        result = {}
+        key_type = self._key_type
+        # キーの型は map で一括判定し、不一致がある場合だけキーごとに判定する (エラー順序は従来どおり)
+        keys_ok = all(map(isinstance, value, itertools.repeat(key_type)))
+        if keys_ok and _all_plain_items(self._value_validator, value.values()):
+            return cast("Dict[Any, Any]", self._validate_base(dict(value), data) if self._custom_checks else dict(value))
+
+        result: Dict[Any, Any] = {}
         root_data = data if data is not None else {}
+        value_validator = self._value_validator
+        leaf = cast(Validator, value_validator) if _is_leaf_validator(value_validator) else None
+        key_plans = _build_key_plans(value_validator) if type(value_validator) is dict and value else None
         for k, v in value.items():
-            if not isinstance(k, self._key_type):
-                raise TypeError(f"Expected key type {self._key_type.__name__}, got {type(k).__name__}")
+            if not keys_ok and not isinstance(k, key_type):
+                raise TypeError(f"Expected key type {key_type.__name__}, got {type(k).__name__}")
+            if leaf is not None:
+                if v is None and leaf._optional:
+                    result[k] = None
+                    continue
+                try:
+                    result[k] = leaf.validate(v, root_data)
+                except (TypeError, ValueError) as e:
+                    item_path = f"{path_prefix}.{k}" if path_prefix else f"{k}"
+                    result[k] = _report_validator_error(leaf, e, item_path, v, collect_errors, errors)
+                continue
             # Use path_prefix to build nested path
             item_path = f"{path_prefix}.{k}" if path_prefix else f"{k}"
-            res = validate_internal(v, self._value_validator, root_data, path_prefix=item_path, collect_errors=collect_errors, errors=errors)
+            res = _validate_internal(
+                v, value_validator, root_data, path_prefix=item_path,
+                collect_errors=collect_errors, errors=errors, key_plans=key_plans,
+            )
             result[k] = res
-        return cast(Dict[Any, Any], self._validate_base(result, data))
+        return cast("Dict[Any, Any]", self._validate_base(result, data) if self._custom_checks else result)
 
 class OneOfValidator(Validator):
+    __slots__ = ("_choices", "_choices_set")
+
     def __init__(self, choices: List[Any]) -> None:
         super().__init__()
-        self._choices = choices
+        # 候補は生成時点の内容をタプルで保持し、渡したリストを後から変更しても frozenset とずれないようにする
+        self._choices: Tuple[Any, ...] = tuple(choices)
+        # ハッシュ可能な候補は frozenset で O(1) 判定し、非ハッシュ可能な候補を含む場合はタプル走査に戻す
+        self._choices_set: Optional[FrozenSet[Any]]
+        try:
+            self._choices_set = frozenset(self._choices)
+        except TypeError:
+            self._choices_set = None
 
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Any:
-        if value not in self._choices:
-            raise ValueError(f"Value '{value}' is not one of {self._choices}")
-        return self._validate_base(value, data)
+        choices_set = self._choices_set
+        if choices_set is not None:
+            try:
+                hit = value in choices_set
+            except TypeError:
+                # value 自体が非ハッシュ可能 (list など) な場合
+                hit = value in self._choices
+        else:
+            hit = value in self._choices
+        if not hit:
+            raise ValueError(f"Value '{value}' is not one of {list(self._choices)}")
+        return self._validate_base(value, data) if self._custom_checks else value
 
 class InstanceValidator(Validator):
     """カスタム型（任意のクラス）の isinstance チェックを行うバリデータ。
@@ -370,6 +603,8 @@ class InstanceValidator(Validator):
         validate({"tz": pytz.utc}, schema)
     """
 
+    __slots__ = ("_instance_type",)
+
     def __init__(self, type_cls: Type[Any]) -> None:
         super().__init__()
         self._instance_type = type_cls
@@ -392,9 +627,11 @@ class InstanceValidator(Validator):
                 raise TypeError(
                     f"Expected instance of {self._instance_type.__name__}, got {type(value).__name__}"
                 )
-        return self._validate_base(value, data)
+        return self._validate_base(value, data) if self._custom_checks else value
 
 class DateTimeValidator(Validator):
+    __slots__ = ("_after", "_after_now", "_before", "_before_now")
+
     def __init__(self) -> None:
         super().__init__()
         self._after: Optional[dt_module.datetime] = None
@@ -466,9 +703,11 @@ class DateTimeValidator(Validator):
             if check_val >= cmp_before:
                 raise ValueError(f"Datetime {value} must be before {self._before}")
             
-        return self._validate_base(value, data)
+        return self._validate_base(value, data) if self._custom_checks else value
 
 class UUIDValidator(Validator):
+    __slots__ = ("_version",)
+
     def __init__(self) -> None:
         super().__init__()
         self._version: Optional[int] = None
@@ -478,6 +717,9 @@ class UUIDValidator(Validator):
         return self
 
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Any:
+        # uuid は import 時間が大きいため、実際に検証するまで読み込まない
+        import uuid as uuid_module
+
         if self._coerce and isinstance(value, str):
             try:
                 value = uuid_module.UUID(value)
@@ -489,38 +731,41 @@ class UUIDValidator(Validator):
                 u = uuid_module.UUID(value)
                 if self._version and u.version != self._version:
                     raise ValueError(f"UUID version must be {self._version}, got {u.version}")
-                return self._validate_base(value, data)
+                return self._validate_base(value, data) if self._custom_checks else value
             except ValueError:
                 raise ValueError(f"Invalid UUID string: {value}")
         elif isinstance(value, uuid_module.UUID):
             if self._version and value.version != self._version:
                 raise ValueError(f"UUID version must be {self._version}, got {value.version}")
-            return self._validate_base(value, data)
+            return self._validate_base(value, data) if self._custom_checks else value
         else:
             raise TypeError(f"Expected UUID string or instance, got {type(value).__name__}")
 
 class MACValidator(Validator):
+    __slots__ = ()
+
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> str:
         if not isinstance(value, str):
             raise TypeError(f"Expected str for MAC address, got {type(value).__name__}")
         
-        pattern = r"^([0-9A-Fa-f]{2}[:-]){5}([0-9A-Fa-f]{2})$"
-        if not re.match(pattern, value):
+        if not _MAC_PATTERN.match(value):
             raise ValueError(f"Invalid MAC address format: {value}")
-        return cast(str, self._validate_base(value, data))
+        return cast(str, self._validate_base(value, data) if self._custom_checks else value)
 
 class SIDValidator(Validator):
+    __slots__ = ()
+
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> str:
         if not isinstance(value, str):
             raise TypeError(f"Expected str for SID, got {type(value).__name__}")
         
-        # S-1-[0-5]-(?:\d+-){1,14}\d+
-        pattern = r"^S-\d+-(?:\d+-){1,14}\d+$"
-        if not re.match(pattern, value):
+        if not _SID_PATTERN.match(value):
             raise ValueError(f"Invalid Windows SID format: {value}")
-        return cast(str, self._validate_base(value, data))
+        return cast(str, self._validate_base(value, data) if self._custom_checks else value)
 
 class HWIDValidator(Validator):
+    __slots__ = ("_hex_only", "_length")
+
     def __init__(self) -> None:
         super().__init__()
         self._length: Optional[int] = None
@@ -541,12 +786,14 @@ class HWIDValidator(Validator):
         if self._length and len(value) != self._length:
             raise ValueError(f"HWID length must be {self._length}, got {len(value)}")
         
-        if self._hex_only and not re.match(r"^[0-9A-Fa-f]+$", value):
+        if self._hex_only and not _HEX_PATTERN.match(value):
             raise ValueError(f"HWID must be a hex string: {value}")
             
-        return cast(str, self._validate_base(value, data))
+        return cast(str, self._validate_base(value, data) if self._custom_checks else value)
 
 class IPValidator(Validator):
+    __slots__ = ("_v4_only", "_v6_only")
+
     def __init__(self) -> None:
         super().__init__()
         self._v4_only = False
@@ -561,6 +808,8 @@ class IPValidator(Validator):
         return self
 
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Any:
+        import ipaddress
+
         if self._coerce and isinstance(value, str):
             try:
                 value = ipaddress.ip_address(value)
@@ -574,11 +823,13 @@ class IPValidator(Validator):
                 raise ValueError(f"IP address must be IPv4, got IPv{ip.version} ({value})")
             if self._v6_only and ip.version != 6:
                 raise ValueError(f"IP address must be IPv6, got IPv{ip.version} ({value})")
-            return self._validate_base(value, data)
+            return self._validate_base(value, data) if self._custom_checks else value
         except ValueError as e:
             raise ValueError(f"Invalid IP address '{value}': {e}")
 
 class SnowflakeValidator(Validator):
+    __slots__ = ()
+
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Union[str, int]:
         if self._coerce and isinstance(value, str) and value.isdigit():
             value = int(value)
@@ -596,20 +847,22 @@ class SnowflakeValidator(Validator):
         else:
             raise TypeError(f"Expected int or str for Snowflake, got {type(value).__name__}")
             
-        return cast(Union[str, int], self._validate_base(value, data))
+        return cast("Union[str, int]", self._validate_base(value, data) if self._custom_checks else value)
 
 class VersionValidator(Validator):
+    __slots__ = ()
+
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> str:
         if not isinstance(value, str):
             raise TypeError(f"Expected str for version, got {type(value).__name__}")
         
-        # Simple SemVer regex
-        pattern = r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?(?:\+[0-9A-Za-z-]+(?:\.[0-9A-Za-z-]+)*)?$"
-        if not re.match(pattern, value):
+        if not _SEMVER_PATTERN.match(value):
             raise ValueError(f"Invalid Semantic Versioning format: {value}")
-        return cast(str, self._validate_base(value, data))
+        return cast(str, self._validate_base(value, data) if self._custom_checks else value)
 
 class URLValidator(Validator):
+    __slots__ = ("_allowed_domains", "_allowed_paths", "_allowed_schemes", "_allowed_subdomains", "_require_query_keys")
+
     def __init__(self) -> None:
         super().__init__()
         self._allowed_schemes: Optional[List[str]] = None
@@ -641,7 +894,9 @@ class URLValidator(Validator):
     def validate(self, value: Any, data: Optional[Dict[str, Any]] = None, path_prefix: str = "", collect_errors: bool = False, errors: Optional[List[Any]] = None) -> Any:
         if not isinstance(value, str):
             raise TypeError(f"Expected str for URL, got {type(value).__name__}")
-        
+
+        import urllib.parse
+
         try:
             parsed = urllib.parse.urlparse(value)
             
@@ -679,9 +934,11 @@ class URLValidator(Validator):
                 raise
             raise ValueError(f"Invalid URL string: {value}")
             
-        return self._validate_base(value, data)
+        return self._validate_base(value, data) if self._custom_checks else value
 
 class EnumValidator(Validator):
+    __slots__ = ("_enum_cls",)
+
     def __init__(self, enum_cls: Type[Enum]) -> None:
         super().__init__()
         self._enum_cls = enum_cls
@@ -699,7 +956,33 @@ class EnumValidator(Validator):
         if not isinstance(value, self._enum_cls):
             raise TypeError(f"Expected {self._enum_cls.__name__}, got {type(value).__name__}")
             
-        return self._validate_base(value, data)
+        return self._validate_base(value, data) if self._custom_checks else value
+
+# 子要素を持たず path_prefix を使わない組み込みバリデータ。ListValidator / DictValidator は
+# 要素がこれらの場合に validate_internal を経由せず直接呼び出します。
+_LEAF_VALIDATOR_TYPES = frozenset({
+    StringValidator,
+    NumberValidator,
+    BoolValidator,
+    OneOfValidator,
+    InstanceValidator,
+    DateTimeValidator,
+    UUIDValidator,
+    MACValidator,
+    SIDValidator,
+    HWIDValidator,
+    IPValidator,
+    SnowflakeValidator,
+    VersionValidator,
+    URLValidator,
+    EnumValidator,
+})
+
+
+def _is_leaf_validator(validator: Any) -> bool:
+    """``validator`` が ``.when()`` を持たない組み込みの末端バリデータかどうかを返します。"""
+    return type(validator) in _LEAF_VALIDATOR_TYPES and validator._when_condition is None
+
 
 class VBuilder:
     def str(self) -> StringValidator:
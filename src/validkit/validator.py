@@ -1,9 +1,12 @@
 from typing import (
     Any,
     Dict,
+    Callable,
     Generic,
+    Iterable,
     List,
     Optional,
+    Tuple,
     TypeVar,
     Union,
     get_args,
@@ -16,7 +19,6 @@ from typing import (
 from collections.abc import Mapping
 import types as _types
 import math
-import dataclasses
 import weakref
 from .v import (
     Validator,
@@ -27,8 +29,13 @@ from .v import (
     BoolValidator,
     ListValidator,
     DictValidator,
+    _bind_validator_functions,
+    _is_leaf_validator,
 )
 
+if TYPE_CHECKING:
+    from .compiled import CompiledSchema
+
 T = TypeVar("T")
 
 # Python 3.10+ introduced types.UnionType for PEP 604 (T | None) syntax.
@@ -41,6 +48,16 @@ _UnionType: Optional[type] = getattr(_types, "UnionType", None)
 # Basic Python types supported as schema shorthand (str, int, float, bool)
 _BASIC_TYPES = (str, int, float, bool)
 _CLASS_SCHEMA_CACHE: "weakref.WeakKeyDictionary[type, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+# The dict a class schema resolves to, wrapped in a Schema so its key plans are kept (and
+# rebuilt on change) like an explicit Schema's. Plain dict schemas belong to the caller and
+# are not tracked across calls, so validate() walks them directly instead.
+_CLASS_SCHEMAS: "weakref.WeakKeyDictionary[type, Schema[Any]]" = weakref.WeakKeyDictionary()
+_MISSING = object()
+# migrate= dicts are turned into an ordered plan of (old key, new key, transform) entries
+# once. dicts cannot be weakly referenced, so entries hold the dict strongly (ruling out
+# id() reuse) and the cache is bounded; the oldest entry is evicted first.
+_MIGRATION_CACHE: Dict[int, Tuple[Dict[str, Any], "_MigrationPlan"]] = {}
+_MIGRATION_CACHE_SIZE = 256
 
 
 def _get_class_annotations(schema: type) -> Dict[str, Any]:
@@ -107,6 +124,74 @@ def _is_class_schema(schema: Any) -> bool:
     )
 
 
+class _DictKeyPlan:
+    """dict スキーマのキー分類を事前計算した結果です。
+
+    ``static_keys`` は環境変数を参照しないキー、``defaulted`` はそのうち
+    ``.default()`` を持つキーとバリデータの対応です (値は検証時にバリデータから読み取ります)。入力に存在しない
+    ``static_keys`` は base / デフォルト値だけで値が決まり、``optional_keys`` は
+    そのうち base もデフォルト値もなければ結果から省略される ``.optional()`` の
+    キーです。``entries`` はスキーマの定義順に並べた ``(キー, サブスキーマ, 末端バリデータ)``
+    で、末端バリデータは ``validate_internal`` を経由せず直接呼び出せる場合だけ設定します
+    (``str`` などの省略記法はここで共有バリデータに置き換えておきます)。
+
+    ``schema`` は分類元の dict そのもので、強参照で保持するため ``id`` が他の dict に
+    再利用されることはありません。``keys`` / ``values`` は作成時のキーと値で、
+    :meth:`is_current` が dict の変更 (キーの追加・削除や値の差し替え) の検出に使います
+    (値は同一性を先に比べるので、差し替えがなければ ``==`` の比較は走りません)。
+    """
+
+    __slots__ = ("defaulted", "entries", "keys", "optional_keys", "schema", "static_keys", "values")
+
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.schema = schema
+        self.keys = tuple(schema)
+        self.values = tuple(schema.values())
+        static_keys = []
+        entries: List[Tuple[str, Any, Optional[Validator]]] = []
+        optional_keys = []
+        defaulted: Dict[str, Validator] = {}
+        for key, sub_schema in schema.items():
+            entries.append((key, sub_schema, _leaf_validator(sub_schema)))
+            if isinstance(sub_schema, Validator):
+                if isinstance(getattr(sub_schema, "_env_key", None), str):
+                    continue
+                if sub_schema._has_default:
+                    defaulted[key] = sub_schema
+                elif sub_schema._optional:
+                    optional_keys.append(key)
+            static_keys.append(key)
+        self.static_keys = frozenset(static_keys)
+        self.optional_keys = frozenset(optional_keys)
+        self.entries = tuple(entries)
+        self.defaulted = defaulted
+
+    def is_current(self) -> bool:
+        """分類元の dict が作成時から変更されていなければ True を返します。"""
+        schema = self.schema
+        return tuple(schema) == self.keys and tuple(schema.values()) == self.values
+
+
+def _leaf_validator(sub_schema: Any) -> Optional[Validator]:
+    """``validate_internal`` を経由せず直接呼び出せるバリデータを返します (省略記法は共有バリデータに置き換えます)。"""
+    if _is_leaf_validator(sub_schema):
+        return cast(Validator, sub_schema)
+    if isinstance(sub_schema, type):
+        return _SHORTHAND_VALIDATORS.get(sub_schema)
+    return None
+
+
+def _build_key_plans(schema: Any, plans: Optional[Dict[int, _DictKeyPlan]] = None) -> Dict[int, _DictKeyPlan]:
+    """dict スキーマとその入れ子 dict ごとの :class:`_DictKeyPlan` を ``id`` で引ける形で構築します。"""
+    if plans is None:
+        plans = {}
+    if isinstance(schema, dict) and id(schema) not in plans:
+        plans[id(schema)] = _DictKeyPlan(schema)
+        for sub_schema in schema.values():
+            _build_key_plans(sub_schema, plans)
+    return plans
+
+
 class Schema(Generic[T]):
     """
     型情報を持つスキーマの薄いラッパーです。IDE による型補完を有効にするために使用します。
@@ -130,8 +215,107 @@ class Schema(Generic[T]):
     より豊かなスキーマ定義が可能になります。
     """
 
+    __slots__ = ("_compiled", "_key_plans", "_plans_generation", "_sample_cache", "_schema")
+
     def __init__(self, schema: Any) -> None:
         self._schema = schema
+        self._compiled: Optional[CompiledSchema] = None
+        self._plans_generation = Validator._options_generation
+        self._key_plans = _build_key_plans(schema)
+        self._sample_cache: Optional[Dict[str, Any]] = None
+
+    def _current_key_plans(self) -> Dict[int, _DictKeyPlan]:
+        """キー分類を返します。
+
+        包んでいる dict (入れ子を含む) が変更されたか、いずれかのバリデータで
+        ``.optional()`` / ``.default()`` / ``.env()`` / ``.when()`` が呼ばれていれば作り直します。
+        """
+        plans = self._key_plans
+        generation = Validator._options_generation
+        if generation == self._plans_generation:
+            for plan in plans.values():
+                if not plan.is_current():
+                    break
+            else:
+                return plans
+        plans = self._key_plans = _build_key_plans(self._schema)
+        self._plans_generation = generation
+        return plans
+
+    def compile(self) -> "CompiledSchema":
+        """
+        スキーマを事前コンパイルし、結果をこの Schema に保持します。
+
+        一度コンパイルすると、以降の ``validate(data, schema)`` は生成済みの
+        検証関数へ直接委譲されます。2 回目以降の呼び出しはキャッシュ済みの
+        :class:`CompiledSchema` を返します。
+
+        Returns:
+            CompiledSchema: コンパイル済みスキーマ。
+
+        Example::
+
+            SCHEMA = Schema({"id": v.int(), "name": v.str()})
+            SCHEMA.compile()
+            validate({"id": 1, "name": "Alice"}, SCHEMA)  # 生成コードで検証
+        """
+        if self._compiled is None:
+            from .compiled import compile as compile_schema
+
+            self._compiled = compile_schema(self._schema)
+        return self._compiled
+
+    if TYPE_CHECKING:
+        @overload
+        def validate(
+            self,
+            data: Any,
+            partial: bool = ...,
+            base: Any = ...,
+            migrate: Optional[Dict[str, Any]] = ...,
+            *,
+            collect_errors: Literal[True],
+        ) -> "ValidationResult": ...
+
+        @overload
+        def validate(
+            self,
+            data: Any,
+            partial: bool = ...,
+            base: Any = ...,
+            migrate: Optional[Dict[str, Any]] = ...,
+            *,
+            collect_errors: Literal[False] = ...,  # default
+        ) -> T: ...
+
+    def validate(
+        self,
+        data: Any,
+        partial: bool = False,
+        base: Any = None,
+        migrate: Optional[Dict[str, Any]] = None,
+        collect_errors: bool = False,
+    ) -> Any:
+        """
+        このスキーマで ``data`` を検証します。``validate(data, schema, ...)`` と同じです。
+
+        :meth:`compile` 済みであれば生成済みの検証関数を直接呼び出します。
+
+        Example::
+
+            SCHEMA = Schema({"id": v.int(), "name": v.str().default("guest")})
+            SCHEMA.compile()
+            SCHEMA.validate({"id": 1})  # {"id": 1, "name": "guest"}
+        """
+        if self._compiled is not None:
+            return self._compiled.validate(
+                data,
+                partial=partial,
+                base=base,
+                migrate=migrate,
+                collect_errors=collect_errors,
+            )
+        return _validate_resolved(data, self._schema, self._current_key_plans(), None, partial, base, migrate, collect_errors)
 
     def generate_sample(self) -> Dict[str, Any]:
         """
@@ -145,6 +329,8 @@ class Schema(Generic[T]):
            (`range()` / `min()` / `max()` がある数値は制約内の代表値を優先)
 
         ネストされた辞書スキーマやリストスキーマも再帰的に処理されます。
+        生成結果は Schema ごとにキャッシュされ、2 回目以降は dict / list を複製して返します
+        (葉の値はデフォルト値などの同一オブジェクトのままです)。
 
         Returns:
             Dict[str, Any]: サンプルデータの辞書。
@@ -160,7 +346,9 @@ class Schema(Generic[T]):
             sample = SCHEMA.generate_sample()
             # -> {"host": "localhost", "port": 5432, "ssl": False}
         """
-        return cast(Dict[str, Any], _generate_sample(self._schema))
+        if self._sample_cache is None:
+            self._sample_cache = cast(Dict[str, Any], _generate_sample(self._schema))
+        return cast(Dict[str, Any], _copy_sample_containers(self._sample_cache))
 
 class ValidationError(Exception):
     def __init__(self, message: str, path: str = "", value: Any = None) -> None:
@@ -181,6 +369,8 @@ class ErrorDetail:
         return f"{self.path}: {self.message} (value: {self.value})"
 
 class ValidationResult:
+    __slots__ = ("_errors", "_materialized_errors", "data")
+
     def __init__(self, data: Any, errors: Optional[List[Any]] = None) -> None:
         self.data = data
         self._errors = errors or []
@@ -193,13 +383,11 @@ class ValidationResult:
         if not self._errors:
             self._materialized_errors = []
             return self._materialized_errors
-        first = self._errors[0]
-        if isinstance(first, ErrorDetail):
-            self._materialized_errors = self._errors
-            return self._materialized_errors
+        # Collectors append either ErrorDetail objects or plain (path, message, value)
+        # tuples; tuples are only turned into ErrorDetail here, on first access.
         self._materialized_errors = [
-            ErrorDetail(path, message, value)
-            for path, message, value in self._errors
+            error if isinstance(error, ErrorDetail) else ErrorDetail(*error)
+            for error in self._errors
         ]
         return self._materialized_errors
 
@@ -339,6 +527,8 @@ def _class_to_schema(cls: type) -> Dict[str, Any]:
     if cached is not None:
         return cached
 
+    import dataclasses
+
     schema: Dict[str, Any] = {}
 
     # 1. Collect fields defined as Validator class attributes (with or without annotation)
@@ -390,6 +580,54 @@ def _class_to_schema(cls: type) -> Dict[str, Any]:
     return schema
 
 
+# Shared validators for the str/int/float/bool shorthand. They are only used internally
+# and never mutated, so one instance per type serves every validate_internal() call.
+_SHORTHAND_VALIDATORS: Dict[type, Validator] = {
+    str: v.str(),
+    int: v.int(),
+    float: v.float(),
+    bool: v.bool(),
+}
+
+
+def _when_allows(
+    condition: Any,
+    root_data: Dict[str, Any],
+    when_cache: Optional[Dict[int, bool]],
+) -> bool:
+    """``.when()`` の条件を評価します。
+
+    ``when_cache`` が渡された場合、同じ条件関数の結果は 1 回の ``validate()`` 呼び出しの間
+    再利用されます (条件関数は常に同じ ``root_data`` を受け取るため)。
+    """
+    if when_cache is None:
+        return bool(condition(root_data))
+    allowed = when_cache.get(id(condition))
+    if allowed is None:
+        allowed = when_cache[id(condition)] = bool(condition(root_data))
+    return allowed
+
+
+def _report_validator_error(
+    schema: Validator,
+    exc: Exception,
+    path: str,
+    value: Any,
+    collect_errors: bool,
+    errors: Optional[List[ErrorDetail]],
+) -> Any:
+    """Validator が送出した TypeError / ValueError を ValidationError に変換します。
+
+    ``collect_errors`` の場合はエラーを ``errors`` に追加し、元の値を返します。
+    """
+    err_msg = schema._custom_error_msg if schema._custom_error_msg else str(exc)
+    err_val = "***" if schema._secret_val else value
+    if collect_errors and errors is not None:
+        errors.append(ErrorDetail(path, err_msg, err_val))
+        return value
+    raise ValidationError(err_msg, path, err_val)
+
+
 def validate_internal(
     value: Any, 
     schema: Any, 
@@ -398,47 +636,42 @@ def validate_internal(
     partial: bool = False,
     base: Any = None,
     collect_errors: bool = False,
-    errors: Optional[List[ErrorDetail]] = None
+    errors: Optional[List[ErrorDetail]] = None,
+    key_plans: Optional[Dict[int, _DictKeyPlan]] = None,
+    when_cache: Optional[Dict[int, bool]] = None,
 ) -> Any:
-    # 1. Shorthand types
-    if isinstance(schema, type) and schema in _BASIC_TYPES:
-        if schema is str:
-            schema = v.str()
-        elif schema is int:
-            schema = v.int()
-        elif schema is float:
-            schema = v.float()
-        elif schema is bool:
-            schema = v.bool()
-
-    # 1b. Class-based schema (class with __annotations__ or Validator class attributes)
-    if _is_class_schema(schema):
-        schema = _class_to_schema(schema)
+    # dict スキーマ (入れ子の dict やリストの要素) は型の同一性だけで判定し、
+    # 1. / 2. の isinstance を省く (dict のサブクラスは 3. の isinstance で扱う)
+    schema_is_dict = type(schema) is dict
+
+    # 1. Shorthand types / class-based schemas (Validator instances skip both checks)
+    if not schema_is_dict and isinstance(schema, type):
+        shorthand = _SHORTHAND_VALIDATORS.get(schema)
+        if shorthand is not None:
+            schema = shorthand
+        # 1b. Class-based schema (class with __annotations__ or Validator class attributes)
+        elif _is_class_schema(schema):
+            schema = _class_to_schema(schema)
 
     # 2. Validator objects
-    if isinstance(schema, Validator):
+    if not schema_is_dict and isinstance(schema, Validator):
         # Allow None if optional
         if value is None and schema._optional:
             return base if base is not None else None
 
         # Check condition if any
-        if schema._when_condition and not schema._when_condition(root_data):
+        if schema._when_condition and not _when_allows(schema._when_condition, root_data, when_cache):
             # If condition not met and we have a base value, use it, else return None (or skip)
             return base
 
         try:
             return schema.validate(value, root_data, path_prefix=path_prefix, collect_errors=collect_errors, errors=errors)
         except (TypeError, ValueError) as e:
-            err_msg = schema._custom_error_msg if schema._custom_error_msg else str(e)
-            err_val = "***" if schema._secret_val else value
-            if collect_errors and errors is not None:
-                errors.append(ErrorDetail(path_prefix, err_msg, err_val))
-                return value
-            raise ValidationError(err_msg, path_prefix, err_val)
+            return _report_validator_error(schema, e, path_prefix, value, collect_errors, errors)
 
     # 3. Dict schemas
-    if isinstance(schema, dict):
-        if value is not None and not isinstance(value, dict):
+    if schema_is_dict or isinstance(schema, dict):
+        if type(value) is not dict and value is not None and not isinstance(value, dict):
             err_msg = f"Expected dict, got {type(value).__name__}"
             if collect_errors and errors is not None:
                 errors.append(ErrorDetail(path_prefix, err_msg, value))
@@ -447,23 +680,43 @@ def validate_internal(
 
         result = {}
         input_dict = value if value is not None else {}
-        base_dict = base if isinstance(base, dict) else {}
-
-        # All keys in schema
-        if not partial:
-            # Check for missing keys
-            pass # We'll check individually
-
-        for key, sub_schema in schema.items():
-            current_path = f"{path_prefix}.{key}" if path_prefix else key
-            val = input_dict.get(key)
-            sub_base = base_dict.get(key)
+        base_dict = base if isinstance(base, dict) and base else None
+
+        # Each key is read once; only keys missing from the input go through the
+        # base/default/env/when resolution below.
+        plan = key_plans.get(id(schema)) if key_plans else None
+        if plan is not None:
+            static_keys = plan.static_keys
+            defaulted = plan.defaulted
+            optional_keys = plan.optional_keys
+            entries: Any = plan.entries
+        else:
+            # validate() に直接渡された dict スキーマなどは呼び出し元が変更しうるため、
+            # キー分類を保持せずにその場で走査する (欠けたキーは下の汎用の解決処理に任せる)
+            static_keys = optional_keys = frozenset()
+            defaulted = {}
+            entries = ((key, sub_schema, _leaf_validator(sub_schema)) for key, sub_schema in schema.items())
+
+        for key, sub_schema, leaf in entries:
+            # current_path はエラー報告と入れ子の検証に渡すときだけ組み立てる
+            val = input_dict.get(key, _MISSING)
+            if val is _MISSING:
+                # base の値が None のキーは「base なし」として扱う (コンパイル済みスキーマと同じ)
+                sub_base = base_dict.get(key) if base_dict is not None else None
+                if key in static_keys:
+                    if sub_base is not None:
+                        result[key] = sub_base
+                        continue
+                    if key in defaulted:
+                        result[key] = defaulted[key]._default_value
+                        continue
+                    if partial or key in optional_keys:
+                        continue
 
-            is_optional = False
-            if isinstance(sub_schema, Validator) and sub_schema._optional:
-                is_optional = True
+                is_optional = False
+                if isinstance(sub_schema, Validator) and sub_schema._optional:
+                    is_optional = True
 
-            if key not in input_dict:
                 env_val = None
                 if isinstance(sub_schema, Validator):
                     env_key = getattr(sub_schema, "_env_key", None)
@@ -477,6 +730,7 @@ def validate_internal(
                                 env_val = decryptor(env_val)
                             except Exception as e:
                                 err_msg = f"Failed to decrypt env var: {e}"
+                                current_path = f"{path_prefix}.{key}" if path_prefix else key
                                 if collect_errors and errors is not None:
                                     errors.append(ErrorDetail(current_path, err_msg, None))
                                     continue
@@ -497,7 +751,7 @@ def validate_internal(
                     
                     # Check condition for requirement
                     if isinstance(sub_schema, Validator) and sub_schema._when_condition:
-                        if not sub_schema._when_condition(root_data):
+                        if not _when_allows(sub_schema._when_condition, root_data, when_cache):
                             # Condition not met, not required
                             continue
 
@@ -511,16 +765,47 @@ def validate_internal(
                         if isinstance(sub_schema, Validator) and sub_schema._custom_error_msg:
                             err_msg = sub_schema._custom_error_msg
                         err_val = "***" if isinstance(sub_schema, Validator) and sub_schema._secret_val else None
+                        current_path = f"{path_prefix}.{key}" if path_prefix else key
                         if collect_errors and errors is not None:
                             errors.append(ErrorDetail(current_path, err_msg, err_val))
                             continue
                         raise ValidationError(err_msg, current_path, err_val)
             
             # Key exists in input or was found in env_val
+            if leaf is not None:
+                # 末端のバリデータは直接呼び出す (validate_internal の Validator 分岐と同じ処理)
+                if val is None and leaf._optional:
+                    result[key] = base_dict.get(key) if base_dict is not None else None
+                    continue
+                try:
+                    result[key] = leaf.validate(val, root_data)
+                except (TypeError, ValueError) as e:
+                    current_path = f"{path_prefix}.{key}" if path_prefix else key
+                    result[key] = _report_validator_error(leaf, e, current_path, val, collect_errors, errors)
+                continue
+
+            current_path = f"{path_prefix}.{key}" if path_prefix else key
             try:
+                if isinstance(sub_schema, Validator):
+                    # list / dict バリデータや .when() 付きなども再帰せずにここで処理する
+                    # (validate_internal の Validator 分岐と同じ処理)
+                    if (val is None and sub_schema._optional) or (
+                        sub_schema._when_condition
+                        and not _when_allows(sub_schema._when_condition, root_data, when_cache)
+                    ):
+                        result[key] = base_dict.get(key) if base_dict is not None else None
+                        continue
+                    try:
+                        result[key] = sub_schema.validate(
+                            val, root_data, path_prefix=current_path, collect_errors=collect_errors, errors=errors
+                        )
+                    except (TypeError, ValueError) as e:
+                        result[key] = _report_validator_error(sub_schema, e, current_path, val, collect_errors, errors)
+                    continue
                 result[key] = validate_internal(
                     val, sub_schema, root_data, current_path, 
-                    partial, sub_base, collect_errors, errors
+                    partial, base_dict.get(key) if base_dict is not None else None,
+                    collect_errors, errors, key_plans, when_cache,
                 )
             except ValidationError:
                 if collect_errors:
@@ -531,7 +816,14 @@ def validate_internal(
         # For now, we only process keys in schema.
         return result
 
-    # 4. Literal / Pre-validated?
+    # 4. 入れ子の Schema は、その Schema が事前計算したキー分類と中身のスキーマで 1 回だけ検証する
+    if isinstance(schema, Schema):
+        return validate_internal(
+            value, schema._schema, root_data, path_prefix,
+            partial, base, collect_errors, errors, schema._current_key_plans(), when_cache,
+        )
+
+    # 5. Literal / Pre-validated?
     return value
 
 
@@ -621,12 +913,12 @@ def _generate_validator_sample(schema: Validator) -> Any:
         return _validate_generated_value(schema, schema._examples[0])
 
     from .v import (
-        StringValidator,
-        NumberValidator,
         BoolValidator,
-        ListValidator,
         DictValidator,
+        ListValidator,
+        NumberValidator,
         OneOfValidator,
+        StringValidator,
     )
 
     if isinstance(schema, StringValidator):
@@ -651,6 +943,20 @@ def _generate_validator_sample(schema: Validator) -> Any:
     return _validate_generated_value(schema, candidate)
 
 
+def _copy_sample_containers(sample: Any) -> Any:
+    """キャッシュ済みサンプルの dict / list だけを再帰的に複製します。"""
+    if isinstance(sample, dict):
+        # 葉の値は dict() でまとめて複製し、入れ子の dict / list だけを置き換える
+        copied = dict(sample)
+        for key, value in sample.items():
+            if isinstance(value, (dict, list)):
+                copied[key] = _copy_sample_containers(value)
+        return copied
+    if isinstance(sample, list):
+        return [_copy_sample_containers(item) for item in sample]
+    return sample
+
+
 def _generate_sample(schema: Any) -> Any:
     """
     スキーマ定義を再帰的に走査し、サンプルデータを生成します。
@@ -670,6 +976,10 @@ def _generate_sample(schema: Any) -> Any:
     if _is_class_schema(schema):
         return _generate_sample(_class_to_schema(schema))
 
+    # 1c. 入れ子の Schema → 中身のスキーマを再帰処理
+    if isinstance(schema, Schema):
+        return _generate_sample(schema._schema)
+
     # 2. Validator オブジェクト
     if isinstance(schema, Validator):
         return _generate_validator_sample(schema)
@@ -680,6 +990,125 @@ def _generate_sample(schema: Any) -> Any:
 
     return None
 
+def _resolve_schema(schema: Any) -> Tuple[Any, Optional[Dict[int, _DictKeyPlan]], Optional[Callable[..., Any]]]:
+    """スキーマを ``(検証用スキーマ, キー分類, クラス変換先)`` に解決します。
+
+    クラス変換先は、元のスキーマが dataclass / NamedTuple の場合にその型、それ以外は None です。
+    """
+    if isinstance(schema, Schema):
+        return schema._schema, schema._current_key_plans(), None
+
+    class_builder: Optional[Callable[..., Any]] = None
+    key_plans: Optional[Dict[int, _DictKeyPlan]] = None
+    # クラス記法のスキーマはキャッシュ済みの dict に解決されるため、キー分類もクラスごとに保持する
+    # (利用者の dict スキーマは呼び出し間で変更されうるので、validate_internal が呼び出しごとに分類する)
+    if _is_class_schema(schema):
+        import dataclasses
+
+        cls = schema
+        if dataclasses.is_dataclass(cls) or (hasattr(cls, "_make") and hasattr(cls, "_fields")):
+            class_builder = cls
+        schema = _class_to_schema(cls)
+        wrapped = _CLASS_SCHEMAS.get(cls)
+        if wrapped is None:
+            wrapped = _CLASS_SCHEMAS[cls] = Schema(schema)
+        key_plans = wrapped._current_key_plans()
+    return schema, key_plans, class_builder
+
+
+_MigrationPlan = Tuple[Tuple[str, Optional[str], Optional[Callable[[Any], Any]]], ...]
+
+
+def _migration_plan(migrate: Dict[str, Any]) -> _MigrationPlan:
+    """``migrate`` の各エントリを (旧キー, 新キー, 変換関数) に分類した手順をキャッシュから返します。"""
+    cached = _MIGRATION_CACHE.get(id(migrate))
+    if cached is not None and cached[0] is migrate:
+        return cached[1]
+    plan = tuple(
+        (old_key, action, None) if isinstance(action, str)
+        else (old_key, None, action) if callable(action)
+        else (old_key, None, None)
+        for old_key, action in migrate.items()
+    )
+    if len(_MIGRATION_CACHE) >= _MIGRATION_CACHE_SIZE:
+        # 他のスレッドが同時に削除・追加していても失敗しないようにする (id() は負にならないので -1 は空の印)。
+        # 走査中にサイズが変わった場合の RuntimeError は無視し、次の追加時に改めて削除する
+        try:
+            _MIGRATION_CACHE.pop(next(iter(_MIGRATION_CACHE), -1), None)
+        except RuntimeError:
+            pass
+    _MIGRATION_CACHE[id(migrate)] = (migrate, plan)
+    return plan
+
+
+def _apply_migration(data: Dict[str, Any], migrate: Dict[str, Any]) -> Dict[str, Any]:
+    # 移行対象のキーが 1 つも無ければコピーせずにそのまま返す。
+    # 両方をキービューにすると小さい方 (通常は migrate) だけを走査して判定できる
+    if migrate.keys().isdisjoint(data.keys()):
+        return data
+    data = data.copy()
+    for old_key, new_key, transform in _migration_plan(migrate):
+        if old_key in data:
+            val = data.pop(old_key)
+            if new_key is not None:
+                data[new_key] = val
+            elif transform is not None:
+                result_action = transform(val)
+                if isinstance(result_action, tuple) and len(result_action) == 2:
+                    new_key, new_val = result_action
+                    data[new_key] = new_val
+                else:
+                    data[old_key] = result_action
+            # Note: if it's a rename, we might want to transform too.
+            # But the prompt example shows them separately.
+    return data
+
+
+def _validate_resolved(
+    data: Any,
+    schema: Any,
+    key_plans: Optional[Dict[int, _DictKeyPlan]],
+    class_builder: Optional[Callable[..., Any]],
+    partial: bool,
+    base: Any,
+    migrate: Optional[Dict[str, Any]],
+    collect_errors: bool,
+) -> Any:
+    if not (partial or migrate or collect_errors) and base is None:
+        # オプションなしの呼び出し (最も多い形) はエラー収集用のリストや分岐を省いて検証する
+        validated_data = validate_internal(data, schema, data, "", False, None, False, None, key_plans, {})
+        if class_builder is not None and isinstance(validated_data, dict):
+            return class_builder(**validated_data)
+        return validated_data
+
+    # Apply migration if any
+    if migrate and isinstance(data, dict):
+        data = _apply_migration(data, migrate)
+
+    errors: List[ErrorDetail] = []
+    try:
+        validated_data = validate_internal(
+            data, schema, root_data=data, 
+            partial=partial, base=base, 
+            collect_errors=collect_errors, errors=errors,
+            key_plans=key_plans, when_cache={},
+        )
+    except ValidationError:
+        if not collect_errors:
+            raise
+        validated_data = data # fallback
+
+    if collect_errors:
+        return ValidationResult(validated_data, errors)
+    # 4. Convert to dataclass/NamedTuple if the original schema was a class and not just a dict.
+    # Partial validation intentionally returns a dict because required constructor
+    # arguments may be absent.
+    if not partial and class_builder is not None and isinstance(validated_data, dict):
+        return class_builder(**validated_data)
+
+    return validated_data
+
+
 if TYPE_CHECKING:
     # Overload definitions are used by type checkers only and skipped at runtime
     @overload
@@ -735,55 +1164,97 @@ def validate(
     migrate: Optional[Dict[str, Any]] = None,
     collect_errors: bool = False,
 ) -> Union[Any, "ValidationResult"]:
-    schema_orig = schema
-    # Unwrap Schema[T] to its underlying dict schema
     if isinstance(schema, Schema):
-        schema = schema._schema
+        # Schema.compile() 済みなら生成コードへそのまま委譲する
+        if schema._compiled is not None:
+            return schema._compiled.validate(
+                data,
+                partial=partial,
+                base=base,
+                migrate=migrate,
+                collect_errors=collect_errors,
+            )
+        return _validate_resolved(data, schema._schema, schema._current_key_plans(), None, partial, base, migrate, collect_errors)
+    resolved, key_plans, class_builder = _resolve_schema(schema)
+    return _validate_resolved(data, resolved, key_plans, class_builder, partial, base, migrate, collect_errors)
 
-    # Apply migration if any
-    if migrate and isinstance(data, dict):
-        data = data.copy()
-        for old_key, action in migrate.items():
-            if old_key in data:
-                val = data.pop(old_key)
-                if isinstance(action, str):
-                    data[action] = val
-                elif callable(action):
-                    result_action = action(val)
-                    if isinstance(result_action, tuple) and len(result_action) == 2:
-                        new_key, new_val = result_action
-                        data[new_key] = new_val
-                    else:
-                        data[old_key] = result_action
-                # Note: if it's a rename, we might want to transform too.
-                # But the prompt example shows them separately.
 
-    errors: List[ErrorDetail] = []
-    try:
-        validated_data = validate_internal(
-            data, schema, root_data=data, 
-            partial=partial, base=base, 
-            collect_errors=collect_errors, errors=errors
-        )
-    except ValidationError:
-        if not collect_errors:
-            raise
-        validated_data = data # fallback
+if TYPE_CHECKING:
+    @overload
+    def validate_many(
+        data_iter: Iterable[Any],
+        schema: Schema[T],
+        partial: bool = ...,
+        base: Any = ...,
+        migrate: Optional[Dict[str, Any]] = ...,
+        *,
+        collect_errors: Literal[True],
+    ) -> List[ValidationResult]: ...
 
-    if collect_errors:
-        return ValidationResult(validated_data, errors)
-    # 4. Convert to dataclass/NamedTuple if the original schema was a class and not just a dict.
-    # Partial validation intentionally returns a dict because required constructor
-    # arguments may be absent.
-    if (
-        not partial
-        and isinstance(schema_orig, type)
-        and _is_class_schema(schema_orig)
-        and isinstance(validated_data, dict)
-    ):
-        if dataclasses.is_dataclass(schema_orig):
-            return schema_orig(**validated_data)
-        if hasattr(schema_orig, "_make") and hasattr(schema_orig, "_fields"):
-            return schema_orig(**validated_data)
+    @overload
+    def validate_many(
+        data_iter: Iterable[Any],
+        schema: Schema[T],
+        partial: bool = ...,
+        base: Any = ...,
+        migrate: Optional[Dict[str, Any]] = ...,
+        *,
+        collect_errors: Literal[False] = ...,  # default
+    ) -> List[T]: ...
 
-    return validated_data
+    @overload
+    def validate_many(
+        data_iter: Iterable[Any],
+        schema: Any,
+        partial: bool = ...,
+        base: Any = ...,
+        migrate: Optional[Dict[str, Any]] = ...,
+        *,
+        collect_errors: Literal[True],
+    ) -> List[ValidationResult]: ...
+
+    @overload
+    def validate_many(
+        data_iter: Iterable[Any],
+        schema: Any,
+        partial: bool = ...,
+        base: Any = ...,
+        migrate: Optional[Dict[str, Any]] = ...,
+        *,
+        collect_errors: Literal[False] = ...,  # default
+    ) -> List[Any]: ...
+
+
+def validate_many(
+    data_iter: Iterable[Any],
+    schema: Any,
+    partial: bool = False,
+    base: Any = None,
+    migrate: Optional[Dict[str, Any]] = None,
+    collect_errors: bool = False,
+) -> List[Any]:
+    """
+    複数のデータを同じスキーマで検証し、結果をリストで返します。
+
+    スキーマの解決 (``Schema.compile()`` 済みかどうか、クラス記法の変換、キー分類の取得) は
+    最初に一度だけ行い、各要素では検証処理だけを実行します。引数の意味は :func:`validate` と同じです。
+
+    ``collect_errors=False`` の場合は最初に不正だった要素の ``ValidationError`` をそのまま送出します。
+    ``collect_errors=True`` の場合は要素ごとの ``ValidationResult`` のリストを返します。
+
+    Example::
+
+        configs = validate_many(raw_configs, GUILD_SETTINGS_SCHEMA)
+    """
+    if isinstance(schema, Schema) and schema._compiled is not None:
+        compiled_validate = schema._compiled.validate
+        return [compiled_validate(data, partial, base, migrate, collect_errors) for data in data_iter]
+    resolved, key_plans, class_builder = _resolve_schema(schema)
+    return [
+        _validate_resolved(data, resolved, key_plans, class_builder, partial, base, migrate, collect_errors)
+        for data in data_iter
+    ]
+
+
+# ListValidator / DictValidator が要素の検証に使う関数を v.py へ登録する (循環 import 回避)
+_bind_validator_functions(validate_internal, _report_validator_error, _build_key_plans)
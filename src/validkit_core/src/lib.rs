@@ -1,7 +1,7 @@
 use std::collections::BTreeMap;
 
 use pyo3::prelude::*;
-use pyo3::types::{PyBool, PyDict, PyFloat, PyList, PyString, PyTuple};
+use pyo3::types::{PyBool, PyDict, PyFloat, PyList, PyLong, PyString, PyTuple};
 
 #[derive(Debug, Clone, PartialEq)]
 pub enum Value<'a> {
@@ -478,6 +478,11 @@ fn is_supported_validator(schema: &Bound<'_, PyAny>) -> PyResult<bool> {
         return Ok(false);
     }
 
+    // The native core only implements exact type checks; `.strict(False)` stays in Python.
+    if !schema.getattr("_strict")?.extract::<bool>()? {
+        return Ok(false);
+    }
+
     let custom_checks = schema.getattr("_custom_checks")?;
     if custom_checks.len()? != 0 {
         return Ok(false);
@@ -580,8 +585,17 @@ fn validate_python_value(schema: &Schema, value: &Bound<'_, PyAny>) -> PyResult<
     }
 }
 
+/// Extracts an `int` only when the value's type is exactly `int`, matching the
+/// Python `type(value) is int` check (so `bool` and `IntEnum` are rejected).
+fn extract_exact_int(value: &Bound<'_, PyAny>) -> Option<i64> {
+    if !value.is_exact_instance_of::<PyLong>() {
+        return None;
+    }
+    value.extract::<i64>().ok()
+}
+
 fn validate_python_int_plain(value: &Bound<'_, PyAny>) -> PyResult<bool> {
-    Ok(value.extract::<i64>().is_ok())
+    Ok(extract_exact_int(value).is_some())
 }
 
 fn validate_python_int(
@@ -589,7 +603,7 @@ fn validate_python_int(
     min: Option<f64>,
     max: Option<f64>,
 ) -> PyResult<bool> {
-    let Ok(number) = value.extract::<i64>() else {
+    let Some(number) = extract_exact_int(value) else {
         return Ok(false);
     };
     if let Some(min) = min {
@@ -612,7 +626,7 @@ fn validate_python_int_exclusive(
     exclusive_min: bool,
     exclusive_max: bool,
 ) -> PyResult<bool> {
-    let Ok(number) = value.extract::<i64>() else {
+    let Some(number) = extract_exact_int(value) else {
         return Ok(false);
     };
     if let Some(min) = min {
@@ -635,7 +649,7 @@ fn validate_python_int_exclusive(
 }
 
 fn validate_python_float_plain(value: &Bound<'_, PyAny>) -> PyResult<bool> {
-    Ok(value.is_instance_of::<PyFloat>())
+    Ok(value.is_exact_instance_of::<PyFloat>())
 }
 
 fn validate_python_float(
@@ -643,7 +657,7 @@ fn validate_python_float(
     min: Option<f64>,
     max: Option<f64>,
 ) -> PyResult<bool> {
-    if !value.is_instance_of::<PyFloat>() {
+    if !value.is_exact_instance_of::<PyFloat>() {
         return Ok(false);
     }
     let number = value.extract::<f64>()?;
@@ -667,7 +681,7 @@ fn validate_python_float_exclusive(
     exclusive_min: bool,
     exclusive_max: bool,
 ) -> PyResult<bool> {
-    if !value.is_instance_of::<PyFloat>() {
+    if !value.is_exact_instance_of::<PyFloat>() {
         return Ok(false);
     }
     let number = value.extract::<f64>()?;
@@ -695,7 +709,7 @@ fn validate_python_str(
     min_len: Option<usize>,
     max_len: Option<usize>,
 ) -> PyResult<bool> {
-    let Ok(text_obj) = value.downcast::<PyString>() else {
+    let Ok(text_obj) = value.downcast_exact::<PyString>() else {
         return Ok(false);
     };
     let text = text_obj.to_str()?;
@@ -868,7 +882,7 @@ fn collect_python_int_plain(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    if value.extract::<i64>().is_ok() {
+    if extract_exact_int(value).is_some() {
         Ok(Some(true))
     } else {
         push_error(py, errors, path, "Expected int", value)?;
@@ -884,7 +898,7 @@ fn collect_python_int(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    let Ok(number) = value.extract::<i64>() else {
+    let Some(number) = extract_exact_int(value) else {
         push_error(py, errors, path, "Expected int", value)?;
         return Ok(Some(false));
     };
@@ -926,7 +940,7 @@ fn collect_python_int_exclusive(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    let Ok(number) = value.extract::<i64>() else {
+    let Some(number) = extract_exact_int(value) else {
         push_error(py, errors, path, "Expected int", value)?;
         return Ok(Some(false));
     };
@@ -984,7 +998,7 @@ fn collect_python_float_plain(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    if value.is_instance_of::<PyFloat>() {
+    if value.is_exact_instance_of::<PyFloat>() {
         Ok(Some(true))
     } else {
         push_error(py, errors, path, "Expected float", value)?;
@@ -1000,7 +1014,7 @@ fn collect_python_float(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    if !value.is_instance_of::<PyFloat>() {
+    if !value.is_exact_instance_of::<PyFloat>() {
         push_error(py, errors, path, "Expected float", value)?;
         return Ok(Some(false));
     }
@@ -1042,7 +1056,7 @@ fn collect_python_float_exclusive(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    if !value.is_instance_of::<PyFloat>() {
+    if !value.is_exact_instance_of::<PyFloat>() {
         push_error(py, errors, path, "Expected float", value)?;
         return Ok(Some(false));
     }
@@ -1102,7 +1116,7 @@ fn collect_python_str(
     path: &str,
     errors: &Bound<'_, PyList>,
 ) -> PyResult<Option<bool>> {
-    let Ok(text_obj) = value.downcast::<PyString>() else {
+    let Ok(text_obj) = value.downcast_exact::<PyString>() else {
         push_error(py, errors, path, "Expected str", value)?;
         return Ok(Some(false));
     };
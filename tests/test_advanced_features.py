@@ -1,9 +1,7 @@
 import unittest
 import os
 from enum import Enum
-import sys
 
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 from validkit import v, validate, ValidationError
 
 class Color(Enum):
@@ -17,11 +17,8 @@ tests/test_class_schema.py
 import datetime
 from typing import Dict, List, Optional
 import sys
-import os
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from validkit import v, validate, ValidationError, Schema, ValidationResult
 
 
@@ -3,20 +3,17 @@ import pytest
 from validkit import v, validate, ValidationError
 
 
-def test_string_coercion():
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        (123, "123"),  # int to str
+        (12.3, "12.3"),  # float to str
+        (True, "True"),  # bool to str
+    ],
+)
+def test_string_coercion(raw: object, expected: str) -> None:
     schema = {"val": v.str().coerce()}
-    
-    # int to str
-    result = validate({"val": 123}, schema)
-    assert result["val"] == "123"
-    
-    # float to str
-    result = validate({"val": 12.3}, schema)
-    assert result["val"] == "12.3"
-    
-    # bool to str
-    result = validate({"val": True}, schema)
-    assert result["val"] == "True"
+    assert validate({"val": raw}, schema)["val"] == expected
 
 def test_int_coercion():
     schema = {"val": v.int().coerce()}
@@ -44,17 +41,18 @@ def test_float_coercion():
     result = validate({"val": 123}, schema)
     assert result["val"] == 123.0
 
+@pytest.mark.parametrize(
+    "raw, expected",
+    [(truthy, True) for truthy in ["true", "True", "1", "yes", "on"]]
+    + [(falsy, False) for falsy in ["false", "False", "0", "no", "off"]],
+)
+def test_bool_coercion_from_str(raw: str, expected: bool) -> None:
+    schema = {"val": v.bool().coerce()}
+    assert validate({"val": raw}, schema)["val"] is expected
+
 def test_bool_coercion():
     schema = {"val": v.bool().coerce()}
-    
-    # str to bool (truthy)
-    for truthy in ["true", "True", "1", "yes", "on"]:
-        assert validate({"val": truthy}, schema)["val"] is True
-        
-    # str to bool (falsy)
-    for falsy in ["false", "False", "0", "no", "off"]:
-        assert validate({"val": falsy}, schema)["val"] is False
-        
+
     # int to bool
     assert validate({"val": 1}, schema)["val"] is True
     assert validate({"val": 0}, schema)["val"] is False
@@ -63,6 +61,24 @@ def test_bool_coercion():
     with pytest.raises(ValidationError):
         validate({"val": "maybe"}, schema)
 
+def test_bool_coercion_table_matches_compiled_and_rejects_other_values():
+    from decimal import Decimal
+    from validkit import compile
+
+    schema = {"val": v.bool().coerce()}
+    compiled = compile(schema)
+    for raw, expected in [("YES", True), ("Off", False), (1.0, True), (-0.0, False), (True, True)]:
+        assert validate({"val": raw}, schema)["val"] is expected
+        assert compiled.validate({"val": raw}, _force_python=True)["val"] is expected
+
+    for raw in [2, float("nan"), Decimal(1), [1], "maybe"]:
+        with pytest.raises(ValidationError) as excinfo:
+            validate({"val": raw}, schema)
+        assert excinfo.value.message == f"Expected bool, got {type(raw).__name__}"
+        with pytest.raises(ValidationError) as excinfo:
+            compiled.validate({"val": raw}, _force_python=True)
+        assert excinfo.value.message == f"Expected bool, got {type(raw).__name__}"
+
 def test_no_coercion_by_default():
     schema = {"val": v.int()}
     with pytest.raises(ValidationError):
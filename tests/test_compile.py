@@ -312,6 +312,43 @@ def test_compile_when_condition_uses_field_base_when_skipped():
     assert result == {"enabled": False, "token": "from-base"}
 
 
+def test_compile_shared_when_condition_runs_once_per_call():
+    from validkit import validate
+
+    calls = []
+
+    def premium(data):
+        calls.append(1)
+        return data.get("is_premium") is True
+
+    schema_dict = {
+        "is_premium": v.bool(),
+        "expiry": v.str().regex(r"^\d{4}-\d{2}-\d{2}$").when(premium),
+        "seats": v.list(v.int().when(premium)),
+        "plan": v.str().when(premium).optional(),
+    }
+    schema = compile(schema_dict)
+    data = {"is_premium": True, "expiry": "2026-01-01", "seats": [1, 2, 3]}
+
+    assert schema.validate(data) == data
+    assert len(calls) == 1
+
+    calls.clear()
+    assert schema.validate({"is_premium": False, "expiry": "not-a-date", "seats": []}) == {
+        "is_premium": False,
+        "expiry": None,
+        "seats": [],
+    }
+    assert len(calls) == 1
+
+    # The interpreted path shares results across the fields of the dict schema.
+    calls.clear()
+    del schema_dict["seats"]
+    del data["seats"]
+    assert validate(data, schema_dict) == data
+    assert len(calls) == 1
+
+
 def test_compile_works_without_native_runtime(monkeypatch):
     class MissingRuntime:
         available = False
@@ -492,3 +529,314 @@ def test_compile_uses_native_collect_runtime_when_available(monkeypatch):
         ("id", "Expected int", "bad")
     ]
     assert calls == {"compile": 1, "collect": 1}
+
+
+def test_schema_compile_is_cached_and_used_by_validate(monkeypatch):
+    from validkit import Schema, validate
+
+    schema = Schema({"id": v.int(), "name": v.str().regex(r"^[a-z]+$")})
+    compiled = schema.compile()
+
+    assert schema.compile() is compiled
+    assert compile(schema) is compiled
+
+    calls = []
+    original_validate = compiled.validate
+
+    def tracking_validate(data, **kwargs):
+        calls.append(kwargs)
+        return original_validate(data, **kwargs)
+
+    monkeypatch.setattr(compiled, "validate", tracking_validate)
+
+    assert validate({"id": 1, "name": "alice"}, schema) == {"id": 1, "name": "alice"}
+    with pytest.raises(ValidationError) as excinfo:
+        validate({"id": 1, "name": "Alice"}, schema)
+    assert excinfo.value.message == "Value 'Alice' does not match regex '^[a-z]+$'"
+    assert len(calls) == 2
+
+
+def test_schema_validate_method_matches_validate_before_and_after_compile():
+    from validkit import Schema, validate
+
+    schema = Schema({"id": v.int(), "name": v.str().default("guest"), "tags": v.list(str).default(None)})
+    bad = {"id": "x", "name": 1}
+
+    before = schema.validate({"id": 1})
+    assert before == validate({"id": 1}, schema) == {"id": 1, "name": "guest", "tags": None}
+    before_errors = [(e.path, e.message) for e in schema.validate(bad, collect_errors=True).errors]
+
+    schema.compile()
+    assert schema.validate({"id": 1}) == before
+    assert schema.validate({"id": 2}, partial=True, base={"name": "bob"}) == {"id": 2, "name": "bob", "tags": None}
+    assert [(e.path, e.message) for e in schema.validate(bad, collect_errors=True).errors] == before_errors
+
+
+def test_compile_oneof_uses_set_membership_and_handles_unhashable_values():
+    schema = compile({
+        "theme": v.oneof(["light", "dark"]),
+        "shape": v.oneof([[1, 2], [3]]),
+    })
+
+    assert schema.validate({"theme": "dark", "shape": [3]}) == {"theme": "dark", "shape": [3]}
+
+    result = schema.validate({"theme": ["dark"], "shape": [4]}, collect_errors=True)
+    assert [(error.path, error.message) for error in result.errors] == [
+        ("theme", "Value '['dark']' is not one of ['light', 'dark']"),
+        ("shape", "Value '[4]' is not one of [[1, 2], [3]]"),
+    ]
+
+
+def test_compile_nested_paths_are_static_and_match_interpreted_paths():
+    from validkit import validate
+
+    schema_dict = {
+        "server": {
+            "limits": {"max_users": v.int().range(1, 10)},
+            "hosts": v.list({"name": v.str(), "port": v.int()}),
+        }
+    }
+    schema = compile(schema_dict)
+    data = {
+        "server": {
+            "limits": {"max_users": 20},
+            "hosts": [{"name": "a", "port": 1}, {"name": "b", "port": "x"}],
+        }
+    }
+
+    compiled_paths = [error.path for error in schema.validate(data, collect_errors=True).errors]
+    interpreted_paths = [error.path for error in validate(data, schema_dict, collect_errors=True).errors]
+    assert compiled_paths == interpreted_paths == ["server.limits.max_users", "server.hosts[1].port"]
+
+
+def test_compile_strict_type_checks_match_interpreted_validation():
+    from validkit import validate
+
+    schema_dict = {
+        "count": v.int(),
+        "loose": v.int().strict(False),
+        "ratio": v.float(),
+        "coerced": v.int().coerce(),
+    }
+    schema = compile(schema_dict)
+    data = {"count": True, "loose": True, "ratio": 1, "coerced": True}
+
+    compiled_errors = schema.validate(data, collect_errors=True)
+    interpreted_errors = validate(data, schema_dict, collect_errors=True)
+    assert [(e.path, e.message) for e in compiled_errors.errors] == [
+        ("count", "Expected int, got bool"),
+        ("ratio", "Expected float, got int"),
+    ]
+    assert [(e.path, e.message) for e in interpreted_errors.errors] == [
+        (e.path, e.message) for e in compiled_errors.errors
+    ]
+    assert schema.validate({"count": 1, "loose": True, "ratio": 1.5, "coerced": True}) == {
+        "count": 1,
+        "loose": True,
+        "ratio": 1.5,
+        "coerced": 1,
+    }
+
+
+def test_compile_numeric_lists_bulk_check_matches_interpreted_validation():
+    from validkit import validate
+
+    schema_dict = {
+        "ids": v.list(v.int().range(0, 100)),
+        "ratios": v.list(v.float().max(1.0, exclusive=True)),
+        "raw": v.list(int),
+    }
+    schema = compile(schema_dict)
+    data = {"ids": (1, 2, 3), "ratios": [0.5, 0.25], "raw": []}
+
+    assert schema.validate(data) == validate(data, schema_dict) == {"ids": [1, 2, 3], "ratios": [0.5, 0.25], "raw": []}
+
+    bad = {"ids": [1, 200, True], "ratios": [0.5, 1.0], "raw": [1, "2"]}
+    compiled_errors = schema.validate(bad, collect_errors=True)
+    interpreted_errors = validate(bad, schema_dict, collect_errors=True)
+    assert [e.path for e in compiled_errors.errors] == ["ids[1]", "ids[2]", "ratios[1]", "raw[1]"]
+    assert [(e.path, e.message) for e in interpreted_errors.errors] == [
+        (e.path, e.message) for e in compiled_errors.errors
+    ]
+
+
+def test_compile_float_lists_bulk_check_does_not_skip_range_errors_after_nan():
+    from validkit import validate
+
+    schema_dict = {"a": v.list(v.float().min(0))}
+    schema = compile(schema_dict)
+    data = {"a": [float("nan"), -5.0]}
+
+    for run in (lambda: validate(data, schema_dict), lambda: schema.validate(data)):
+        with pytest.raises(ValidationError) as exc_info:
+            run()
+        assert str(exc_info.value) == "a[1]: Value -5.0 is less than minimum 0"
+
+
+def test_compile_oneof_lists_bulk_check_matches_interpreted_validation():
+    from validkit import validate
+
+    schema_dict = {
+        "tags": v.list(v.oneof(["a", "b", "c"])),
+        "scores": v.dict(str, v.oneof([1, 2, 3])),
+        "mixed": v.list(v.oneof([[1], "x"])),
+    }
+    schema = compile(schema_dict)
+    data = {"tags": ("a", "c"), "scores": {"x": 1, "y": 3}, "mixed": [[1], "x"]}
+
+    expected = {"tags": ["a", "c"], "scores": {"x": 1, "y": 3}, "mixed": [[1], "x"]}
+    assert schema.validate(data) == validate(data, schema_dict) == expected
+
+    bad = {"tags": ["a", "z", ["a"]], "scores": {"x": 4}, "mixed": ["y"]}
+    compiled_errors = schema.validate(bad, collect_errors=True)
+    interpreted_errors = validate(bad, schema_dict, collect_errors=True)
+    assert [e.path for e in compiled_errors.errors] == ["tags[1]", "tags[2]", "scores.x", "mixed[0]"]
+    assert [(e.path, e.message) for e in interpreted_errors.errors] == [
+        (e.path, e.message) for e in compiled_errors.errors
+    ]
+
+
+def test_compile_required_key_reads_do_not_trigger_dict_subclass_missing():
+    from collections import defaultdict
+
+    schema = compile({"name": v.str(), "age": v.int(), "bio": v.str().optional()})
+    data = defaultdict(lambda: "fallback", {"name": "Alice"})
+
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate(data, _force_python=True)
+    assert exc_info.value.path == "age"
+    assert exc_info.value.message == "Missing required key"
+    assert dict(data) == {"name": "Alice"}
+    assert schema.validate(defaultdict(int, {"name": "Alice", "age": 3}), _force_python=True) == {"name": "Alice", "age": 3}
+
+
+def test_compile_interns_string_schema_keys():
+    import sys
+
+    key = "".join(["表示", "名"])
+    schema = compile({key: v.str(), "nested": {"".join(["lev", "el"]): v.int()}})
+    result = schema.validate({"表示名": "Alice", "nested": {"level": 1}}, _force_python=True)
+
+    assert result == {"表示名": "Alice", "nested": {"level": 1}}
+    result_key = next(iter(result))
+    assert result_key is sys.intern("表示名")
+    assert next(iter(result["nested"])) is sys.intern("level")
+
+
+def test_compile_number_bounds_match_interpreted_validation():
+    from validkit import validate
+
+    schema_dict = {
+        "level": v.int().range(1, 100),
+        "ratio": v.float().range(0.0, 1.0, exclusive_min=True),
+        "limit": v.float().max(float("inf")),
+    }
+    schema = compile(schema_dict)
+
+    for level, ratio in [(0, 0.5), (101, 0.5), (50, 0.0), (50, 1.5), (50, float("nan"))]:
+        data = {"level": level, "ratio": ratio, "limit": 1e308}
+        compiled_errors = schema.validate(data, collect_errors=True)
+        interpreted_errors = validate(data, schema_dict, collect_errors=True)
+        assert [(e.path, e.message) for e in compiled_errors.errors] == [
+            (e.path, e.message) for e in interpreted_errors.errors
+        ]
+
+    assert schema.validate({"level": 100, "ratio": 1.0, "limit": 1.0}) == {"level": 100, "ratio": 1.0, "limit": 1.0}
+
+
+def test_compile_lazy_item_paths_match_interpreted_paths():
+    from validkit import validate
+
+    schema_dict = {
+        "matrix": v.list(v.list(v.int())),
+        "users": v.list({"tags": v.dict(str, v.list(v.str()))}),
+    }
+    schema = compile(schema_dict)
+    data = {
+        "matrix": [[1, 2], [3, "x"]],
+        "users": [{"tags": {"ok": ["a"]}}, {"tags": {"bad": ["a", 1]}}, {}],
+    }
+
+    compiled_errors = schema.validate(data, collect_errors=True)
+    interpreted_errors = validate(data, schema_dict, collect_errors=True)
+    assert [e.path for e in compiled_errors.errors] == [
+        "matrix[1][1]",
+        "users[1].tags.bad[1]",
+        "users[2].tags",
+    ]
+    assert [(e.path, e.message) for e in interpreted_errors.errors] == [
+        (e.path, e.message) for e in compiled_errors.errors
+    ]
+    with pytest.raises(ValidationError) as exc_info:
+        schema.validate(data)
+    assert exc_info.value.path == "matrix[1][1]"
+
+
+def test_compile_dict_validator_bulk_checks_keep_error_order():
+    from validkit import validate
+
+    schema_dict = {
+        "counts": v.dict(str, v.int().min(0)),
+        "punish": v.dict(int, v.list(v.str())),
+    }
+    schema = compile(schema_dict)
+    ok = {"counts": {"a": 1, "b": 2}, "punish": {1: ["warn"], 3: ["mute", "ban"]}}
+    assert schema.validate(ok) == validate(ok, schema_dict) == ok
+
+    bad = {"counts": {"a": -1, "b": 2}, "punish": {1: [0], "x": ["warn"]}}
+    compiled_errors = schema.validate(bad, collect_errors=True)
+    interpreted_errors = validate(bad, schema_dict, collect_errors=True)
+    assert [(e.path, e.message) for e in compiled_errors.errors] == [
+        ("counts.a", "Value -1 is less than minimum 0"),
+        ("punish.1[0]", "Expected str, got int"),
+        ("punish", "Expected key type int, got str"),
+    ]
+    assert [(e.path, e.message) for e in interpreted_errors.errors] == [
+        (e.path, e.message) for e in compiled_errors.errors
+    ]
+
+
+def test_compile_dict_validator_bulk_check_does_not_skip_range_errors_after_nan():
+    from validkit import validate
+
+    schema_dict = {"m": v.dict(str, v.float().max(1))}
+    schema = compile(schema_dict)
+    data = {"m": {"a": float("nan"), "b": 5.0}}
+
+    for run in (lambda: validate(data, schema_dict), lambda: schema.validate(data)):
+        with pytest.raises(ValidationError) as exc_info:
+            run()
+        assert str(exc_info.value) == "m.b: Value 5.0 is greater than maximum 1"
+    with pytest.raises(ValidationError):
+        validate({"a": float("nan"), "b": 5.0}, v.dict(str, v.float().max(1)))
+
+
+def test_compile_collect_errors_runs_user_callables_once(monkeypatch):
+    calls = []
+    monkeypatch.setenv("VALIDKIT_TEST_COLLECT_SECRET", "enc")
+
+    def check(value):
+        calls.append(("custom", value))
+        return value
+
+    def condition(data):
+        calls.append(("when", None))
+        return True
+
+    def decrypt(value):
+        calls.append(("decrypt", value))
+        return "plain"
+
+    schema = compile({
+        "name": v.str().custom(check),
+        "extra": v.int().when(condition),
+        "secret": v.str().env("VALIDKIT_TEST_COLLECT_SECRET", decrypt),
+        "count": v.int(),
+    })
+    result = schema.validate({"name": "a", "extra": 1, "count": "x"}, collect_errors=True)
+
+    assert [(e.path, e.message) for e in result.errors] == [("count", "Expected int, got str")]
+    assert sorted(calls) == [("custom", "a"), ("decrypt", "enc"), ("when", None)]
+    # ユーザー関数を含まないスキーマは、従来どおり例外を投げる検証で先に判定する
+    assert compile({"n": v.list(v.int().range(0, 9))})._probe_before_collect is True
+    assert schema._probe_before_collect is False
@@ -208,6 +208,28 @@ class TestGenerateSample:
         sample2 = schema.generate_sample()
         assert sample1 == sample2
 
+    def test_generate_sample_is_cached_and_returns_independent_copies(self):
+        """generate_sample() は結果をキャッシュし、呼び出しごとに独立したコピーを返す"""
+        calls = []
+
+        def track(value):
+            calls.append(value)
+            return value
+
+        schema = Schema({
+            "hosts": v.list(v.str()).default(["a", "b"]),
+            "db": {"name": v.str().custom(track)},
+            "rows": v.list({"id": v.int()}),
+        })
+        sample1 = schema.generate_sample()
+        sample1["hosts"].append("c")
+        sample1["db"]["name"] = "changed"
+        sample1["rows"][0]["id"] = 99
+
+        sample2 = schema.generate_sample()
+        assert sample2 == {"hosts": ["a", "b"], "db": {"name": "example"}, "rows": [{"id": 0}]}
+        assert len(calls) == 1
+
     def test_number_range_uses_lower_bound_when_zero_is_out_of_range(self):
         """int の range 制約がある場合、0 ではなく範囲内の代表値を返す"""
         schema = Schema({"level": v.int().range(1, 100)})
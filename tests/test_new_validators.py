@@ -2,11 +2,6 @@ import unittest
 import datetime
 import uuid
 import ipaddress
-import sys
-import os
-
-# Add src to path
-sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 
 from validkit import v, validate, ValidationError
 
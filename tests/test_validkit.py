@@ -1,8 +1,9 @@
+import pickle
 from typing import TypedDict
 
 import pytest
 
-from validkit import v, validate, ValidationError, Schema, ValidationResult
+from validkit import v, validate, validate_many, ValidationError, Schema, ValidationResult
 
 def test_basic_types():
     assert validate("hello", v.str()) == "hello"
@@ -15,12 +16,43 @@ def test_basic_types():
     with pytest.raises(ValidationError):
         validate("123", v.int())
 
+def test_strict_type_checks_reject_subclasses_by_default():
+    import enum
+
+    class Level(enum.IntEnum):
+        LOW = 1
+
+    class Name(str):
+        pass
+
+    with pytest.raises(ValidationError) as excinfo:
+        validate(True, v.int())
+    assert "Expected int, got bool" in str(excinfo.value)
+    with pytest.raises(ValidationError):
+        validate(Level.LOW, v.int())
+    with pytest.raises(ValidationError):
+        validate(Name("alice"), v.str())
+
+    assert validate(True, v.int().strict(False)) is True
+    assert validate(Level.LOW, v.int().strict(False)) is Level.LOW
+    assert validate(Name("alice"), v.str().strict(False)) == "alice"
+    assert validate(True, v.int().coerce()) == 1
+
 def test_string_regex():
     validator = v.str().regex(r"^\d{3}-\d{4}$")
     assert validate("123-4567", validator) == "123-4567"
     with pytest.raises(ValidationError):
         validate("123-456", validator)
 
+def test_string_regex_shares_compiled_pattern():
+    first = v.str().regex(r"^[a-z]+-\d+$")
+    second = v.str().regex(r"^[a-z]+-\d+$")
+    assert first._regex is second._regex
+    assert validate("abc-1", second) == "abc-1"
+    with pytest.raises(ValidationError) as excinfo:
+        validate("ABC-1", second)
+    assert "does not match regex '^[a-z]+-\\d+$'" in str(excinfo.value)
+
 def test_string_length_min():
     validator = v.str().min(3)
     assert validate("abc", validator) == "abc"
@@ -139,6 +171,60 @@ def test_partial_validation():
     schema = {"a": v.int(), "b": v.int()}
     assert validate({"a": 1}, schema, partial=True) == {"a": 1}
 
+def test_schema_partial_merge_matches_plain_dict_schema(monkeypatch):
+    monkeypatch.setenv("VALIDKIT_TEST_PARTIAL_TOKEN", "from-env")
+    raw = {
+        "a": v.int(),
+        "b": v.int().default(10),
+        "c": v.str().optional(),
+        "token": v.str().env("VALIDKIT_TEST_PARTIAL_TOKEN").default("unused"),
+        "nested": {"x": v.bool().default(False), "y": v.int()},
+    }
+    schema = Schema(raw)
+    base = {"a": 0, "nested": {"y": 1}}
+    expected = {"a": 5, "b": 10, "token": "from-env", "nested": {"y": 1}}
+
+    assert validate({"a": 5}, schema, partial=True, base=base) == expected
+    assert validate({"a": 5}, raw, partial=True, base=base) == expected
+    assert validate({"nested": {}}, schema, partial=True) == validate({"nested": {}}, raw, partial=True) == {
+        "b": 10,
+        "token": "from-env",
+        "nested": {"x": False},
+    }
+    with pytest.raises(ValidationError, match="nested.y: Missing required key"):
+        validate({"a": 1, "nested": {}}, schema)
+
+def test_schema_partial_merge_reads_default_values_at_validation_time():
+    y = v.int().default(1)
+    schema = Schema({"y": y, "n": {"z": v.str().default("a")}})
+    assert validate({"n": {}}, schema, partial=True) == {"y": 1, "n": {"z": "a"}}
+
+    y.default(2)
+    schema._schema["n"]["z"].default("b")
+    assert validate({"n": {}}, schema, partial=True) == {"y": 2, "n": {"z": "b"}}
+    assert validate({"n": {}}, schema) == {"y": 2, "n": {"z": "b"}}
+
+def test_schema_key_plans_follow_validator_options_added_later(monkeypatch):
+    x = v.str()
+    schema = Schema({"flag": v.bool(), "a": x})
+    assert validate({"flag": True, "a": "s"}, schema) == {"flag": True, "a": "s"}
+
+    # 構築後に .when() を付けた末端バリデータも、条件を評価してから検証する
+    x.when(lambda d: d["flag"])
+    assert validate({"flag": False, "a": 1}, schema) == {"flag": False, "a": None}
+    with pytest.raises(ValidationError, match="a: Expected str, got int"):
+        validate({"flag": True, "a": 1}, schema)
+
+    # 構築後の .default() / .env() も、欠けたキーの補完に反映される
+    y = v.int()
+    schema = Schema({"y": y})
+    assert validate({}, schema, partial=True, base={"y": 1}) == {"y": 1}
+    y.default(5)
+    assert validate({}, schema, partial=True) == {"y": 5}
+    monkeypatch.setenv("VALIDKIT_TEST_LATE_ENV", "7")
+    y.coerce().env("VALIDKIT_TEST_LATE_ENV")
+    assert validate({}, schema, partial=True, base={"y": 1}) == {"y": 7}
+
 def test_base_merge():
     schema = {"a": v.int(), "b": v.int()}
     base = {"b": 2}
@@ -207,6 +293,27 @@ def test_oneof_with_int():
     with pytest.raises(ValidationError):
         validate(4, validator)
 
+def test_oneof_handles_unhashable_values_and_choices():
+    from validkit import compile
+
+    validator = v.oneof(["light", "dark"])
+    with pytest.raises(ValidationError) as excinfo:
+        validate(["light"], validator)
+    assert "is not one of ['light', 'dark']" in str(excinfo.value)
+
+    unhashable = v.oneof([[1, 2], {"mode": "x"}])
+    assert validate([1, 2], unhashable) == [1, 2]
+    with pytest.raises(ValidationError):
+        validate([3], unhashable)
+
+    choices = ["a", [1]]
+    snapshot = v.oneof(choices)
+    choices.append("b")
+    for check in (lambda value: validate(value, snapshot), compile(snapshot).validate):
+        assert check([1]) == [1]
+        with pytest.raises(ValidationError, match=r"Value 'b' is not one of \['a', \[1\]\]"):
+            check("b")
+
 def test_list_of_nested_dicts_and_errors():
     schema = v.list({"meta": {"code": v.int()}})
     data = [{"meta": {"code": 200}}, {"meta": {"code": "404"}}]
@@ -257,3 +364,383 @@ def test_collect_errors_without_exception():
     assert result.has_errors is False
     assert result.error_count == 0
     assert result.errors == []
+
+
+def test_import_defers_compiled_module_and_optional_stdlib_modules():
+    import os
+    import subprocess
+    import sys
+
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+    code = (
+        "import sys, validkit\n"
+        "print(sorted(m for m in ('validkit.compiled', 'uuid', 'ipaddress', 'urllib.parse') if m in sys.modules))\n"
+        "validkit.compile\n"
+        "print('validkit.compiled' in sys.modules)\n"
+        "print(vars(validkit)['compile'] is validkit.compiled.compile, 'CompiledSchema' in vars(validkit))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=src_dir)
+    output = subprocess.run([sys.executable, "-S", "-c", code], env=env, capture_output=True, text=True, check=True).stdout
+    # 一度解決した属性はモジュールの名前空間に保存され、以後 __getattr__ を経由しない
+    assert output.split("\n")[:3] == ["[]", "True", "True False"]
+
+
+def test_schema_and_validation_result_use_slots():
+    schema = Schema({"a": v.int()})
+    result = validate({"a": "x"}, schema, collect_errors=True)
+
+    assert not hasattr(schema, "__dict__")
+    assert not hasattr(result, "__dict__")
+    assert result.errors[0].path == "a"
+
+
+def test_container_and_conditional_fields_in_dict_keep_base_paths_and_errors():
+    from validkit.v import NumberValidator
+
+    class Even(NumberValidator):
+        def validate(self, value, data=None, path_prefix="", collect_errors=False, errors=None):
+            if value % 2:
+                raise ValueError("odd")
+            return value
+
+    schema = Schema({
+        "mode": v.str(),
+        "extra": v.int().when(lambda d: d.get("mode") == "x"),
+        "tags": v.list(v.str()).optional(),
+        "grid": v.list(v.list(v.int())),
+        "even": Even(int).error_msg("must be even"),
+    })
+    base = {"extra": 7, "tags": ["kept"]}
+
+    assert validate({"mode": "y", "extra": "ignored", "tags": None, "grid": [], "even": 2}, schema, base=base) == {
+        "mode": "y", "extra": 7, "tags": ["kept"], "grid": [], "even": 2
+    }
+    result = validate({"mode": "x", "extra": "3", "grid": [[1, "2"]], "even": 3}, schema, collect_errors=True)
+    assert [(e.path, e.message) for e in result.errors] == [
+        ("extra", "Expected int, got str"),
+        ("grid[0][1]", "Expected int, got str"),
+        ("even", "must be even"),
+    ]
+
+
+def test_dict_schemas_inside_list_and_dict_validators_use_key_plans():
+    row = {"id": int, "tag": v.str().default("x"), "note": v.str().optional(), "meta": {"ok": v.bool()}}
+    schema = Schema({"rows": v.list(row), "by_name": v.dict(str, row)})
+    data = {
+        "by_name": {"a": {"id": 1, "meta": {"ok": True}}},
+        "rows": [{"meta": {"ok": False}, "id": 2}, {"id": "3", "meta": {}}],
+    }
+
+    result = validate(data, schema, collect_errors=True)
+    assert result.data["by_name"] == {"a": {"id": 1, "tag": "x", "meta": {"ok": True}}}
+    assert list(result.data["rows"][0]) == ["id", "tag", "meta"]
+    assert [(e.path, e.message) for e in result.errors] == [
+        ("rows[1].id", "Expected int, got str"),
+        ("rows[1].meta.ok", "Missing required key"),
+    ]
+    # 要素の dict スキーマは呼び出しをまたいで保持しないため、変更が次の検証に反映される
+    row["extra"] = v.int()
+    with pytest.raises(ValidationError) as exc_info:
+        validate({"rows": [{"id": 1, "meta": {"ok": True}}], "by_name": {}}, schema)
+    assert str(exc_info.value) == "rows[0].extra: Missing required key"
+
+
+def test_dict_subclass_schemas_and_inputs_take_the_isinstance_fallback():
+    from collections import OrderedDict, defaultdict
+
+    schema = OrderedDict([("id", v.int()), ("meta", OrderedDict([("ok", v.bool().default(True))]))])
+    data = defaultdict(dict, {"id": 1})
+    data["meta"] = OrderedDict()
+
+    assert validate(data, schema) == {"id": 1, "meta": {"ok": True}}
+    with pytest.raises(ValidationError, match="meta: Expected dict, got list"):
+        validate({"id": 1, "meta": []}, schema)
+
+
+def test_nested_schema_objects_are_validated_with_their_own_key_plans():
+    from dataclasses import dataclass
+    from validkit import compile
+
+    @dataclass
+    class Point:
+        x: int
+
+    child = Schema({"a": v.int(), "b": v.str().default("d")})
+    schema = {"c": child, "items": v.list(child), "point": Schema(Point)}
+    ok = {"c": {"a": 1}, "items": [{"a": 2}], "point": {"x": 3}}
+    expected = {"c": {"a": 1, "b": "d"}, "items": [{"a": 2, "b": "d"}], "point": {"x": 3}}
+
+    for check in (lambda data, **kw: validate(data, schema, **kw), compile(schema).validate):
+        assert check(ok) == expected
+        with pytest.raises(ValidationError, match=r"items\[0\]\.a: Expected int, got str"):
+            check({"c": {"a": 1}, "items": [{"a": "x"}], "point": {"x": 3}})
+    result = validate({"c": {"a": "x"}, "items": [], "point": {}}, schema, collect_errors=True)
+    assert [(e.path, e.message) for e in result.errors] == [
+        ("c.a", "Expected int, got str"),
+        ("point.x", "Missing required key"),
+    ]
+    assert Schema(schema).generate_sample()["c"] == {"a": 0, "b": "d"}
+
+
+def test_builtin_validators_use_slots_and_custom_subclasses_keep_dict():
+    import copy
+    import enum
+    from validkit.v import Validator
+
+    class Color(enum.Enum):
+        RED = "red"
+
+    validators = [
+        v.str(), v.int(), v.float(), v.bool(), v.list(int), v.dict(str, int), v.oneof([1]),
+        v.instance(int), v.datetime(), v.uuid(), v.mac(), v.sid(), v.hwid(), v.ip(),
+        v.snowflake(), v.version(), v.url(), v.enum(Color),
+    ]
+    for validator in validators:
+        assert not hasattr(validator, "__dict__"), type(validator).__name__
+
+    copied = copy.deepcopy(v.str().min(2).regex(r"^a").optional())
+    assert (copied._min_len, copied._regex.pattern, copied._optional) == (2, "^a", True)
+
+    class EvenValidator(Validator):
+        def __init__(self):
+            super().__init__()
+            self.label = "even"
+
+        def validate(self, value, data=None, path_prefix="", collect_errors=False, errors=None):
+            if value % 2:
+                raise ValueError(f"{value} is not {self.label}")
+            return self._validate_base(value, data)
+
+    assert validate({"n": 2}, {"n": EvenValidator()}) == {"n": 2}
+
+
+def test_validation_error_keeps_formatted_args_and_pickles():
+    err = ValidationError("Expected int, got str", "a.b", "x")
+    assert str(err) == "a.b: Expected int, got str"
+    assert err.args == ("a.b: Expected int, got str",)
+    assert repr(err) == "ValidationError('a.b: Expected int, got str')"
+    assert (err.message, err.path, err.value) == ("Expected int, got str", "a.b", "x")
+    assert str(ValidationError("Missing required key")) == "Missing required key"
+
+    restored = pickle.loads(pickle.dumps(ValidationError("bad", path="k", value=1)))
+    assert (str(restored), restored.path, restored.value) == ("k: bad", "k", 1)
+
+
+def test_custom_checks_are_not_shared_between_validators():
+    upper = v.str().custom(str.upper).custom(lambda value: value + "!")
+    plain = v.str()
+
+    assert validate("a", upper) == "A!"
+    assert validate("a", plain) == "a"
+    assert plain._custom_checks == () and plain._examples == ()
+    assert v.str().examples(["x"])._examples == ["x"]
+
+
+def test_plain_dict_schemas_follow_mutations_between_calls():
+    schema = {"a": v.int()}
+    assert validate({"a": 1}, schema) == {"a": 1}
+
+    schema["b"] = v.int()
+    with pytest.raises(ValidationError) as exc_info:
+        validate({"a": 1}, schema)
+    assert str(exc_info.value) == "b: Missing required key"
+
+    schema["b"] = v.int().default(2)
+    schema["c"] = {"d": v.str().optional()}
+    assert validate({"a": 1, "c": {}}, schema) == {"a": 1, "b": 2, "c": {}}
+    schema["c"]["d"] = v.str().default("x")
+    assert validate({"a": 1, "c": {}}, schema) == {"a": 1, "b": 2, "c": {"d": "x"}}
+
+
+def test_schema_objects_follow_mutations_of_the_wrapped_dict():
+    raw = {"a": v.int(), "n": {"x": v.int()}}
+    schema = Schema(raw)
+    assert validate({"a": 1, "n": {"x": 1}}, schema) == {"a": 1, "n": {"x": 1}}
+
+    raw["b"] = v.int()
+    with pytest.raises(ValidationError) as exc_info:
+        validate({"a": 1, "n": {"x": 1}}, schema)
+    assert str(exc_info.value) == "b: Missing required key"
+
+    # 入れ子の dict の差し替えと、差し替え後の dict の変更も反映される
+    del raw["b"]
+    raw["n"] = {"y": v.str()}
+    with pytest.raises(ValidationError) as exc_info:
+        validate({"a": 1, "n": {"x": 1}}, schema)
+    assert str(exc_info.value) == "n.y: Missing required key"
+    raw["n"]["y"] = v.str().default("d")
+    assert validate({"a": 1, "n": {}}, schema) == {"a": 1, "n": {"y": "d"}}
+
+    # キー分類は元の dict を強参照で保持するため、id の再利用で別の dict の分類が使われることはない
+    plans = schema._current_key_plans()
+    assert plans[id(raw)].schema is raw and plans[id(raw["n"])].schema is raw["n"]
+
+
+def test_migration_plan_is_cached_and_keeps_entry_order(monkeypatch):
+    import validkit.validator as validator_module
+    from validkit import compile
+
+    monkeypatch.setattr(validator_module, "_MIGRATION_CACHE", {})
+    schema = {"name": v.str(), "timeout": v.str(), "extra": v.int().optional()}
+    migrate = {
+        "user_name": "name",
+        "name": lambda n: n.upper(),
+        "seconds": lambda s: ("timeout", f"{s}s"),
+        "extra": None,
+    }
+    data = {"user_name": "alice", "seconds": 30, "extra": 1}
+
+    expected = {"name": "ALICE", "timeout": "30s"}
+    assert validate(data, schema, migrate=migrate) == expected
+    assert compile(schema).validate(data, migrate=migrate) == expected
+    assert list(validator_module._MIGRATION_CACHE) == [id(migrate)]
+    assert data == {"user_name": "alice", "seconds": 30, "extra": 1}
+
+    # 移行対象のキーが無ければ入力 dict をコピーしない
+    current = {"timeout": "5s"}
+    assert validator_module._apply_migration(current, migrate) is current
+
+
+def test_migration_cache_eviction_tolerates_concurrent_removal(monkeypatch):
+    import validkit.validator as validator_module
+
+    # 上限 0 は、満杯と判定した直後に他のスレッドがエントリを削除し終えた状態と同じになる
+    monkeypatch.setattr(validator_module, "_MIGRATION_CACHE", {})
+    monkeypatch.setattr(validator_module, "_MIGRATION_CACHE_SIZE", 0)
+    first, second = {"a": "b"}, {"c": "d"}
+    assert validate({"a": 1}, {"b": int}, migrate=first) == {"b": 1}
+    assert validate({"c": 2}, {"d": int}, migrate=second) == {"d": 2}
+    assert list(validator_module._MIGRATION_CACHE) == [id(second)]
+
+
+def test_shorthand_types_do_not_build_validators_per_call(monkeypatch):
+    from validkit.v import VBuilder
+
+    schema = {"a": int, "b": str, "c": float, "d": bool, "items": v.list(int)}
+    for name in ("str", "int", "float", "bool"):
+        monkeypatch.setattr(VBuilder, name, lambda self: pytest.fail("validator built per call"))
+
+    assert validate({"a": 1, "b": "x", "c": 1.5, "d": True, "items": [1, 2]}, schema) == {
+        "a": 1, "b": "x", "c": 1.5, "d": True, "items": [1, 2]
+    }
+    with pytest.raises(ValidationError) as excinfo:
+        validate({"a": 1, "b": "x", "c": 1.5, "d": 1, "items": []}, schema)
+    assert (excinfo.value.path, excinfo.value.message) == ("d", "Expected bool, got int")
+
+    result = validate({"a": None, "c": "1.5", "d": True, "items": []}, Schema(schema), collect_errors=True)
+    assert [(e.path, e.message) for e in result.errors] == [
+        ("a", "Expected int, got NoneType"),
+        ("b", "Missing required key"),
+        ("c", "Expected float, got str"),
+    ]
+
+
+def test_list_and_dict_leaf_items_keep_paths_and_error_options():
+    schema = {
+        "tags": v.list(v.str().min(2).error_msg("tag too short")),
+        "tokens": v.dict(str, v.str().secret()),
+        "maybe": v.list(v.int().optional()),
+        "nested": v.list(v.list(v.int())),
+    }
+    data = {"tags": ["ok", "x"], "tokens": {"a": 1}, "maybe": [1, None, "2"], "nested": [[1], [2, "3"]]}
+
+    result = validate(data, schema, collect_errors=True)
+    assert [(e.path, e.message, e.value) for e in result.errors] == [
+        ("tags[1]", "tag too short", "x"),
+        ("tokens.a", "Expected str, got int", "***"),
+        ("maybe[2]", "Expected int, got str", "2"),
+        ("nested[1][1]", "Expected int, got str", "3"),
+    ]
+    with pytest.raises(ValidationError) as excinfo:
+        validate(data, schema)
+    assert (excinfo.value.path, excinfo.value.message) == ("tags[1]", "tag too short")
+    assert validate({"tags": [], "tokens": {}, "maybe": [None, 1], "nested": []}, schema)["maybe"] == [None, 1]
+
+
+def test_nested_dict_leaf_fields_keep_paths_base_and_error_options():
+    schema = {
+        "user": {
+            "profile": {
+                "name": v.str().min(2).error_msg("name too short"),
+                "token": v.str().secret(),
+                "nick": v.str().optional(),
+            }
+        }
+    }
+    data = {"user": {"profile": {"name": "x", "token": 1, "nick": None}}}
+
+    result = validate(data, schema, collect_errors=True)
+    assert [(e.path, e.message, e.value) for e in result.errors] == [
+        ("user.profile.name", "name too short", "x"),
+        ("user.profile.token", "Expected str, got int", "***"),
+    ]
+    with pytest.raises(ValidationError) as excinfo:
+        validate({"user": {"profile": {"name": "ok"}}}, schema)
+    assert (excinfo.value.path, excinfo.value.message) == ("user.profile.token", "Missing required key")
+
+    base = {"user": {"profile": {"nick": "bob"}}}
+    ok = {"user": {"profile": {"name": "al", "token": "t", "nick": None}}}
+    assert validate(ok, schema, base=base)["user"]["profile"]["nick"] == "bob"
+
+
+def test_dict_schema_key_plan_keeps_order_defaults_and_base_resolution():
+    schema = Schema({
+        "id": v.int(),
+        "name": v.str().default("guest"),
+        "note": v.str().optional(),
+        "extra": v.int().when(lambda d: d.get("id") == 1),
+        "meta": {"tag": v.str().default("t")},
+    })
+
+    assert list(validate({"meta": {}, "id": 2}, schema)) == ["id", "name", "meta"]
+    assert validate({"id": 3, "note": None, "meta": {}}, schema, base={"note": "kept"}) == {
+        "id": 3, "name": "guest", "note": "kept", "meta": {"tag": "t"}
+    }
+    with pytest.raises(ValidationError) as excinfo:
+        validate({"id": 1, "meta": {}}, schema)
+    assert (excinfo.value.path, excinfo.value.message) == ("extra", "Missing required key")
+    assert validate({"id": 1}, schema, partial=True) == {"id": 1, "name": "guest"}
+
+
+def test_missing_optional_keys_skip_resolution_and_none_base_means_no_base():
+    from validkit import compile
+
+    raw = {
+        "id": v.int(),
+        "note": v.str().optional(),
+        "flag": v.bool().optional().when(lambda d: d.get("id") == 1),
+    }
+    schema = Schema(raw)
+    compiled = compile(raw)
+
+    for data, base, expected in [
+        ({"id": 1}, None, {"id": 1}),
+        ({"id": 2}, {"note": "kept", "flag": None}, {"id": 2, "note": "kept"}),
+        ({}, {"id": None}, None),
+    ]:
+        if expected is None:
+            with pytest.raises(ValidationError, match="id: Missing required key"):
+                validate(data, schema, base=base)
+            with pytest.raises(ValidationError, match="id: Missing required key"):
+                compiled.validate(data, base=base)
+        else:
+            assert validate(data, schema, base=base) == expected
+            assert compiled.validate(data, base=base) == expected
+
+
+def test_validate_many_matches_validate_per_item():
+    schema = {"id": v.int(), "name": v.str().default("anon")}
+    items = [{"id": 1}, {"id": 2, "name": "Bob"}]
+
+    assert validate_many(items, schema) == [validate(item, schema) for item in items]
+    assert validate_many(iter(items), Schema(schema), partial=True) == [{"id": 1, "name": "anon"}, {"id": 2, "name": "Bob"}]
+
+    results = validate_many([{"id": "x"}, {"id": 3}], schema, collect_errors=True)
+    assert [r.error_count for r in results] == [1, 0]
+    assert results[0].errors[0].path == "id"
+    with pytest.raises(ValidationError, match="id: Expected int"):
+        validate_many([{"id": 1}, {"id": "x"}], schema)
+
+    compiled = Schema(schema)
+    compiled.compile()
+    assert validate_many(items, compiled) == [{"id": 1, "name": "anon"}, {"id": 2, "name": "Bob"}]